@@ -34,9 +34,15 @@ from flowchem.server.core import Flowchem
     help="Server host. 0.0.0.0 is used to bind to all addresses, do not use for internet-exposed devices!",
 )
 @click.option("-d", "--debug", is_flag=True, help="Print debug info.")
+@click.option(
+    "--no-access-log",
+    "no_access_log",
+    is_flag=True,
+    help="Do not log every HTTP request, recommended for clients polling the devices at high rate.",
+)
 @click.version_option()
 @click.command()
-def main(device_config_file, logfile, host, debug):
+def main(device_config_file, logfile, host, debug, no_access_log):
     """Flowchem main program.
 
     Parse device_config_file and starts a server exposing the devices via REST-ful API.
@@ -47,9 +53,19 @@ def main(device_config_file, logfile, host, debug):
         logfile: Output file for logs.
         host: IP on which the server will be listening. Loopback IP as default, use LAN IP to enable remote access.
         debug: Print debug info
+        no_access_log: Disable uvicorn access log
     """
     if sys.platform == "win32":
         asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    else:
+        # The event loop is created here and shared with uvicorn, so uvicorn's `loop="auto"` does not apply.
+        # Use uvloop when available (`pip install flowchem[speed]`).
+        try:
+            import uvloop
+
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
 
     if not debug:
         # Set stderr to info
@@ -71,6 +87,7 @@ def main(device_config_file, logfile, host, debug):
             host=host,
             port=flowchem.port,
             log_level="info",
+            access_log=not no_access_log,
             timeout_keep_alive=3600,
         )
         server = uvicorn.Server(config)
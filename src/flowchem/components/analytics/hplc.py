@@ -27,6 +27,9 @@ class HPLCControl(FlowchemComponent):
         Run an HPLC sample using the specified sample and method.
     """
 
+    # Ontology: high performance liquid chromatography instrument
+    OWL_SUBCLASSES: tuple[str, ...] = ("http://purl.obolibrary.org/obo/OBI_0001057",)
+
     def __init__(self, name: str, hw_device: FlowchemDevice) -> None:
         """
         Constructs all the necessary attributes for the HPLCControl object.
@@ -42,10 +45,6 @@ class HPLCControl(FlowchemComponent):
         self.add_api_route("/run-sample", self.run_sample, methods=["PUT"])
         self.add_api_route("/send-method", self.send_method, methods=["PUT"])
 
-        # Ontology: high performance liquid chromatography instrument
-        self.component_info.owl_subclass_of.append(
-            "http://purl.obolibrary.org/obo/OBI_0001057",
-        )
         self.component_info.type = "HPLC Control"
 
     async def send_method(self, method_name):
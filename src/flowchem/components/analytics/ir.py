@@ -18,16 +18,15 @@ class IRSpectrum(BaseModel):
 
 
 class IRControl(FlowchemComponent):
+    # Ontology: high performance liquid chromatography instrument
+    OWL_SUBCLASSES: tuple[str, ...] = ("http://purl.obolibrary.org/obo/OBI_0001057",)
+
     def __init__(self, name: str, hw_device: FlowchemDevice) -> None:
         """HPLC Control component. Sends methods, starts run, do stuff."""
         super().__init__(name, hw_device)
         self.add_api_route("/acquire-spectrum", self.acquire_spectrum, methods=["PUT"])
         self.add_api_route("/stop", self.stop, methods=["PUT"])
 
-        # Ontology: high performance liquid chromatography instrument
-        self.component_info.owl_subclass_of.append(
-            "http://purl.obolibrary.org/obo/OBI_0001057",
-        )
         self.component_info.type = "IR Control"
 
     async def acquire_spectrum(self) -> IRSpectrum:  # type: ignore
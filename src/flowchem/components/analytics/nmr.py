@@ -7,16 +7,15 @@ from flowchem.devices.flowchem_device import FlowchemDevice
 
 
 class NMRControl(FlowchemComponent):
+    # Ontology: fourier transformation NMR instrument
+    OWL_SUBCLASSES: tuple[str, ...] = ("http://purl.obolibrary.org/obo/OBI_0000487",)
+
     def __init__(self, name: str, hw_device: FlowchemDevice) -> None:
         """NMR Control component."""
         super().__init__(name, hw_device)
         self.add_api_route("/acquire-spectrum", self.acquire_spectrum, methods=["PUT"])
         self.add_api_route("/stop", self.stop, methods=["PUT"])
 
-        # Ontology: fourier transformation NMR instrument
-        self.component_info.owl_subclass_of.append(
-            "http://purl.obolibrary.org/obo/OBI_0000487",
-        )
         self.component_info.type = "NMR Control"
 
     async def acquire_spectrum(self, background_tasks: BackgroundTasks):
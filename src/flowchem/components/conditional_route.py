@@ -0,0 +1,44 @@
+"""API route answering conditional GET requests of polling clients."""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+
+class ConditionalGetRoute(APIRoute):
+    """
+    APIRoute tagging GET responses with an `ETag` and honouring `If-None-Match`.
+
+    The ETag is a digest of the serialized body, so it changes whenever the state changes, regardless of whether the
+    change was commanded through the API or happened on the hardware side. Clients polling an unchanged state (e.g.
+    `/is_open`, `/read`) get an empty `304 Not Modified` instead of the full body. Combined with
+    `FlowchemDevice.state_cache_ttl`, such polls are answered without any hardware I/O.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+        if "GET" not in (self.methods or ()):
+            return handler
+
+        async def conditional_handler(request: Request) -> Response:
+            response = await handler(request)
+            body = getattr(response, "body", None)
+            if response.status_code != 200 or not isinstance(body, bytes):
+                return response
+            etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+            if etag in _etags(request.headers.get("if-none-match", "")):
+                return Response(status_code=304, headers={"ETag": etag})
+            response.headers["ETag"] = etag
+            return response
+
+        return conditional_handler
+
+
+def _etags(header: str) -> set[str]:
+    """Parse the entity tags of an `If-None-Match` header, ignoring the weak `W/` prefix."""
+    return {tag.strip().removeprefix("W/") for tag in header.split(",")}
@@ -9,6 +9,7 @@ from fastapi import APIRouter
 from loguru import logger
 
 from flowchem.components.component_info import ComponentInfo
+from flowchem.components.conditional_route import ConditionalGetRoute
 
 if TYPE_CHECKING:
     from flowchem.devices.flowchem_device import FlowchemDevice
@@ -31,15 +32,42 @@ class FlowchemComponent:
         Metadata about the component.
     _router : APIRouter
         The API router for the component to define HTTP endpoints.
+    ROUTES : tuple[tuple[str, str, list[str]], ...]
+        Class-level route table of ``(path, endpoint_name, methods)`` entries. The tables of all the classes in the
+        MRO are merged (base classes first) once, when the subclass is created, and registered on every instance.
+    OWL_SUBCLASSES : tuple[str, ...]
+        Class-level ontology URIs, merged along the MRO like ``ROUTES`` (without duplicates) and added to
+        ``component_info.owl_subclass_of``.
+    POLLING_ROUTES : tuple[str, ...]
+        Class-level paths of the GET routes that clients poll for state, merged along the MRO like ``ROUTES``. Their
+        responses carry an ``ETag`` and unchanged states are answered with ``304 Not Modified``
+        (see ``ConditionalGetRoute``).
 
     Methods:
     --------
     add_api_route(path: str, endpoint: Callable, **kwargs):
         Add an API route to the component's router.
+    _register_routes():
+        Register the routes declared in the class-level route tables.
     get_component_info() -> ComponentInfo:
         Retrieve the component's metadata.
     """
 
+    ROUTES: tuple[tuple[str, str, list[str]], ...] = ()
+    OWL_SUBCLASSES: tuple[str, ...] = ()
+    POLLING_ROUTES: tuple[str, ...] = ()
+    _route_table: tuple[tuple[str, str, list[str]], ...] = ()
+    _owl_table: tuple[str, ...] = ()
+    _polling_table: frozenset[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Merge the class-level tables along the MRO, so that instances do not redo it."""
+        super().__init_subclass__(**kwargs)
+        cls._route_table = cls._merged("ROUTES")
+        # Ordered union: a URI re-declared by a subclass is listed once
+        cls._owl_table = tuple(dict.fromkeys(cls._merged("OWL_SUBCLASSES")))
+        cls._polling_table = frozenset(cls._merged("POLLING_ROUTES"))
+
     def __init__(self, name: str, hw_device: FlowchemDevice) -> None:
         """
         Initialize the FlowchemComponent with a name and associated hardware device.
@@ -60,6 +88,7 @@ class FlowchemComponent:
                 cls.__name__ for cls in inspect.getmro(self.__class__)
             ],
         )
+        self.component_info.owl_subclass_of.extend(self._owl_table)
 
         # Initialize router
         self._router = APIRouter(
@@ -72,6 +101,7 @@ class FlowchemComponent:
             methods=["GET"],
             response_model=ComponentInfo,
         )
+        self._register_routes()
 
     @property
     def router(self):
@@ -105,6 +135,40 @@ class FlowchemComponent:
         logger.debug(f"Adding route {path} for router of {self.name}")
         self._router.add_api_route(path, endpoint, **kwargs)
 
+    @classmethod
+    def _merged(cls, attribute: str) -> tuple:
+        """
+        Return a class-level tuple attribute merged along the MRO.
+
+        Parameters:
+        -----------
+        attribute : str
+            The name of the class attribute, e.g. ``ROUTES``.
+
+        Returns:
+        --------
+        tuple
+            The entries declared by every class in the MRO, base classes first.
+        """
+        return tuple(
+            entry
+            for klass in reversed(inspect.getmro(cls))
+            for entry in klass.__dict__.get(attribute, ())
+        )
+
+    def _register_routes(self):
+        """Register the routes declared in the class-level route tables on the component's router."""
+        for path, endpoint_name, methods in self._route_table:
+            if path in self._polling_table:
+                self.add_api_route(
+                    path,
+                    getattr(self, endpoint_name),
+                    methods=methods,
+                    route_class_override=ConditionalGetRoute,
+                )
+            else:
+                self.add_api_route(path, getattr(self, endpoint_name), methods=methods)
+
     def get_component_info(self) -> ComponentInfo:
         """
         Retrieve the component's metadata.
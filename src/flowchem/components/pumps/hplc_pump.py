@@ -5,13 +5,12 @@ from flowchem.devices.flowchem_device import FlowchemDevice
 
 
 class HPLCPump(Pump):
+    # Ontology: HPLC isocratic pump
+    OWL_SUBCLASSES: tuple[str, ...] = ("http://purl.obolibrary.org/obo/OBI_0000556",)
+
     def __init__(self, name: str, hw_device: FlowchemDevice) -> None:
         super().__init__(name, hw_device)
 
-        # Ontology: HPLC isocratic pump
-        self.component_info.owl_subclass_of.append(
-            "http://purl.obolibrary.org/obo/OBI_0000556",
-        )
         self.component_info.type = "HPLC Pump"
 
     @staticmethod
@@ -20,6 +20,9 @@ class PressureSensor(Sensor):
         Read the current pressure from the sensor and return it in the specified units.
     """
 
+    # Ontology: Pressure Sensor Device (NCIT_C50167)
+    OWL_SUBCLASSES: tuple[str, ...] = ("http://purl.obolibrary.org/obo/NCIT_C50167",)
+
     def __init__(self, name: str, hw_device: FlowchemDevice) -> None:
         """
         Constructs all the necessary attributes for the PressureSensor object.
@@ -34,11 +37,6 @@ class PressureSensor(Sensor):
         super().__init__(name, hw_device)
         self.add_api_route("/read-pressure", self.read_pressure, methods=["GET"])
 
-        # Ontology: Pressure Sensor Device (NCIT_C50167)
-        self.component_info.owl_subclass_of.append(
-            "http://purl.obolibrary.org/obo/NCIT_C50167",
-        )
-
     async def read_pressure(self, units: str = "bar") -> float:
         """
         Read the current pressure from the sensor and return it in the specified units.
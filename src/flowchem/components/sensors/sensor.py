@@ -23,6 +23,9 @@ class Sensor(AnalogDigitalConverter):
         Power off the sensor.
     """
 
+    # Ontology: Sensor (NCIT_C50166 — measurement device / sensor)
+    OWL_SUBCLASSES: tuple[str, ...] = ("http://purl.obolibrary.org/obo/NCIT_C50166",)
+
     def __init__(self, name: str, hw_device: FlowchemDevice) -> None:
         """
         Constructs all the necessary attributes for the Sensor object.
@@ -37,10 +40,6 @@ class Sensor(AnalogDigitalConverter):
         super().__init__(name, hw_device)
         self.add_api_route("/power-on", self.power_on, methods=["PUT"])
         self.add_api_route("/power-off", self.power_off, methods=["PUT"])
-        # Ontology: Sensor (NCIT_C50166 — measurement device / sensor)
-        self.component_info.owl_subclass_of.append(
-            "http://purl.obolibrary.org/obo/NCIT_C50166",
-        )
 
     async def power_on(self):
         """Power on the sensor."""
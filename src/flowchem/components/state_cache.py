@@ -0,0 +1,61 @@
+"""Short-lived cache for component states read from the hardware."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class StateCache:
+    """
+    Per-key TTL cache absorbing polling bursts on state reads (e.g. `/is-on`, `/read`).
+
+    Values fetched from the hardware are served from memory for `ttl` seconds. Concurrent reads of a key share a
+    single in-flight fetch, so N overlapping requests result in one hardware transaction. Commands changing the state
+    must call `invalidate()`, so that the next read always reaches the hardware. A fetch started before an
+    invalidation is neither stored nor joined by later reads, as its value may predate the command.
+
+    A `ttl` of 0 (default) disables the caching of values: every read not overlapping another one is forwarded to
+    the hardware.
+    """
+
+    def __init__(self, ttl: float = 0) -> None:
+        self.ttl = ttl
+        self._entries: dict[Hashable, tuple[Any, float]] = {}
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        self._generation = 0
+
+    async def get(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for `key`, awaiting `fetch()` if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() < entry[1]:
+            return entry[0]
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._fetch(key, fetch))
+            self._inflight[key] = inflight
+        # Shield the shared fetch, so that a cancelled caller does not cancel it for the others
+        return await asyncio.shield(inflight)
+
+    async def _fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        generation = self._generation
+        try:
+            value = await fetch()
+        finally:
+            if self._inflight.get(key) is asyncio.current_task():
+                del self._inflight[key]
+        if self.ttl > 0 and generation == self._generation:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+        return value
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """Drop the entry for `key`, or all the entries if no key is given."""
+        self._generation += 1
+        if key is None:
+            self._entries.clear()
+            self._inflight.clear()
+        else:
+            self._entries.pop(key, None)
+            self._inflight.pop(key, None)
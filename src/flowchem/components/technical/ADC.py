@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from flowchem.components.flowchem_component import FlowchemComponent
+from flowchem.components.state_cache import StateCache
 from flowchem.devices.flowchem_device import FlowchemDevice
 
 
@@ -19,17 +20,18 @@ class AnalogDigitalConverter(FlowchemComponent):
             extended with the SOSA ontology subclass `Observation`.
     """
 
+    ROUTES: tuple[tuple[str, str, list[str]], ...] = (("/read", "read", ["GET"]),)
+    POLLING_ROUTES: tuple[str, ...] = ("/read",)
+
+    # Ontology: Act of carrying out an (Observation)
+    # Procedure to estimate or calculate a value of a property of a
+    # FeatureOfInterest. Links to a Sensor to describe what made the
+    # Observation and how;
+    OWL_SUBCLASSES: tuple[str, ...] = ("http://www.w3.org/ns/sosa/Observation",)
+
     def __init__(self, name: str, hw_device: FlowchemDevice) -> None:
         super().__init__(name, hw_device)
-        self.add_api_route("/read", self.read, methods=["GET"])
-
-        # Ontology: Act of carrying out an (Observation)
-        # Procedure to estimate or calculate a value of a property of a
-        # FeatureOfInterest. Links to a Sensor to describe what made the
-        # Observation and how;
-        self.component_info.owl_subclass_of.append(
-            "http://www.w3.org/ns/sosa/Observation",
-        )
+        self._state_cache = StateCache(hw_device.state_cache_ttl)
 
     async def read(self) -> float:
         """
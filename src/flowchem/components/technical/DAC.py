@@ -1,8 +1,33 @@
 from __future__ import annotations
 
+import re
+from functools import lru_cache
+from tokenize import TokenError
+
+from flowchem import ureg
 from flowchem.components.flowchem_component import FlowchemComponent
 from flowchem.devices.flowchem_device import FlowchemDevice
 
+# Fast path for the common "<number> <unit>" voltage strings, skipping the pint parser
+_VALUE_RE = re.compile(
+    r"\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*([A-Za-z]*)\s*"
+)
+_UNIT_FACTORS = {"": 1.0, "V": 1.0, "mV": 1e-3, "kV": 1e3}
+
+
+# Setpoints repeat (e.g. "0 V", "2.5 V"), so parsed values are memoized by their string
+@lru_cache(maxsize=256)
+def _volts_from_str(value: str) -> float:
+    match = _VALUE_RE.fullmatch(value)
+    if match is not None and match.group(2) in _UNIT_FACTORS:
+        return float(match.group(1)) * _UNIT_FACTORS[match.group(2)]
+    try:
+        quantity = ureg(value)
+    except (AssertionError, ArithmeticError, TokenError) as e:
+        # pint's parser fails on malformed expressions (e.g. "2 +", "1/0 V", "(2 V")
+        raise ValueError(f"Invalid voltage expression: {value!r}") from e
+    return quantity.m_as("V")
+
 
 class DigitalAnalogConverter(FlowchemComponent):
     """
@@ -14,6 +39,11 @@ class DigitalAnalogConverter(FlowchemComponent):
     within the Flowchem framework.
     """
 
+    ROUTES: tuple[tuple[str, str, list[str]], ...] = (
+        ("/set", "set", ["PUT"]),
+        ("/read", "read", ["GET"]),
+    )
+
     def __init__(self, name: str, hw_device: FlowchemDevice) -> None:
         """
         Initialize a DigitalAnalogConverter component.
@@ -23,11 +53,29 @@ class DigitalAnalogConverter(FlowchemComponent):
             hw_device: The underlying hardware device this component controls.
 
         Notes:
-            Registers an API route ``/channel`` for setting channel values.
+            Registers the API routes ``/set`` and ``/read`` declared in ``ROUTES``.
         """
         super().__init__(name, hw_device)
-        self.add_api_route("/set", self.set, methods=["PUT"])
-        self.add_api_route("/read", self.read, methods=["GET"])
+
+    @staticmethod
+    def _parse_volts(value: str) -> float:
+        """
+        Parse a voltage string (e.g. "2.5 V", "500 mV") into volts.
+
+        Plain numbers are interpreted as volts. Values with other units are parsed
+        with the unit registry. Results are memoized, invalid values are not.
+
+        Args:
+            value: The voltage as a string in "magnitude and unit" format.
+
+        Returns:
+            The voltage in volts.
+
+        Raises:
+            UndefinedUnitError, DimensionalityError: If the value is not a valid voltage.
+            ValueError: If the value is not a valid expression.
+        """
+        return _volts_from_str(value)
 
     async def read(self) -> float:
         """
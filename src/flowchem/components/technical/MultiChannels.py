@@ -1,15 +1,20 @@
+import struct
+
+from fastapi import Response
+
 from flowchem.components.technical.ADC import AnalogDigitalConverter
 from flowchem.components.technical.DAC import DigitalAnalogConverter
 from flowchem.components.technical.relay import Relay
+from flowchem.devices.flowchem_device import FlowchemDevice
 
 
 class MultiChannelADC(AnalogDigitalConverter):
 
-    def __init__(self, *args, **kwargs):
-
-        super().__init__(*args, **kwargs)
-
-        self.add_api_route("/read_all", self.read_all, methods=["GET"])
+    ROUTES: tuple[tuple[str, str, list[str]], ...] = (
+        ("/read_all", "read_all", ["GET"]),
+        ("/read_all_raw", "read_all_raw", ["GET"]),
+    )
+    POLLING_ROUTES: tuple[str, ...] = ("/read_all",)
 
     async def read(self, channel: str) -> float:  # type: ignore[override]
         """
@@ -27,15 +32,40 @@ class MultiChannelADC(AnalogDigitalConverter):
         """
         Read all ADC (Analog-to-Digital Converter) channels.
 
+        Implementations should query all the channels in a single hardware transaction
+        rather than looping over `read`, as each serial round-trip dominates the cost.
+
         Returns:
             dict[str, float]: Mapping of channel IDs (e.g. "ADC1", "ADC2") to measured
             voltage values in volts.
         """
         raise NotImplementedError
 
+    async def read_all_raw(self) -> Response:
+        """
+        Read all ADC channels as packed binary samples, skipping JSON serialization.
+
+        The body holds one little-endian float32 voltage (in volts) per channel, in the
+        order given by the `X-Channels` header. Decode with `np.frombuffer(body, "<f4")`.
+        """
+        values = await self.read_all()
+        raw = struct.pack(f"<{len(values)}f", *values.values())
+        return Response(
+            content=raw,
+            media_type="application/octet-stream",
+            headers={"X-Channels": ",".join(values)},
+        )
+
 
 class MultiChannelDAC(DigitalAnalogConverter):
 
+    n_channels: int = 2
+
+    def __init__(self, name: str, hw_device: FlowchemDevice) -> None:
+        super().__init__(name, hw_device)
+        # Channel label ("1".."n") → 0-based index, validated with a single dict lookup.
+        self._ch_idx = {str(i): i - 1 for i in range(1, self.n_channels + 1)}
+
     async def read(self, channel: str) -> float:  # type: ignore[override]
         """
         Read the DAC output of a channel.
@@ -61,17 +91,22 @@ class MultiChannelDAC(DigitalAnalogConverter):
 
 class MultiChannelRelay(Relay):
 
-    def __init__(self, *args, **kwargs):
+    ROUTES: tuple[tuple[str, str, list[str]], ...] = (
+        ("/multiple_channel", "switch_multiple_channel", ["PUT"]),
+        ("/channels_set_point", "read_channels_set_point", ["GET"]),
+    )
 
-        super().__init__(*args, **kwargs)
+    n_channels: int = 8
 
-        self.add_api_route(
-            "/multiple_channel", self.switch_multiple_channel, methods=["PUT"]
-        )
+    def __init__(self, name: str, hw_device: FlowchemDevice) -> None:
+        super().__init__(name, hw_device)
+        # Channel label ("1".."n") → 0-based index, validated with a single dict lookup.
+        self._ch_idx = {str(i): i - 1 for i in range(1, self.n_channels + 1)}
 
-        self.add_api_route(
-            "/channels_set_point", self.read_channels_set_point, methods=["GET"]
-        )
+    @property
+    def channels(self) -> tuple[str, ...]:
+        """Labels of the channels accepted by this relay."""
+        return tuple(self._ch_idx)
 
     async def power_on(self, channel: str) -> bool:  # type: ignore[override]
         """
@@ -107,6 +142,7 @@ class MultiChannelRelay(Relay):
         Returns:
             bool: True if the relay is ON, False if it is OFF.
         """
+        # Not cached: the generic relay commands have no hook to invalidate a cached state
         value = await self.read_channel_set_point(channel)
         if value is not None:
             return value > 0
@@ -119,6 +155,9 @@ class MultiChannelRelay(Relay):
         """
         Set the relay states of all channels.
 
+        Implementations should send all the channel states in one composite hardware
+        command, rather than one command per channel.
+
         Channel states:
             * 0 → OFF
             * 1 → ON
@@ -9,10 +9,13 @@ from flowchem.devices.flowchem_device import FlowchemDevice
 class PowerSwitch(FlowchemComponent):
     """A generic power on/off switch."""
 
+    ROUTES: tuple[tuple[str, str, list[str]], ...] = (
+        ("/power-on", "power_on", ["PUT"]),
+        ("/power-off", "power_off", ["PUT"]),
+    )
+
     def __init__(self, name: str, hw_device: FlowchemDevice) -> None:
         super().__init__(name, hw_device)
-        self.add_api_route("/power-on", self.power_on, methods=["PUT"])
-        self.add_api_route("/power-off", self.power_off, methods=["PUT"])
 
     async def power_on(self):
         """Turn power on."""
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+from weakref import WeakValueDictionary
+
 from flowchem.components.technical.power import PowerSwitch
 from flowchem.devices.flowchem_device import FlowchemDevice
 
@@ -21,11 +24,22 @@ class Relay(PowerSwitch):
         - **Performs function**: ``saref:OnOffFunction`` or ``saref:OpenCloseFunction``
 
     Attributes:
-        INSTANCES (dict[str, Relay]): Registry of all Relay instances, keyed by
-            ``"<device_name>/<relay_name>"`` for connection tracking.
+        INSTANCES (WeakValueDictionary[str, Relay]): Registry of the live Relay
+            instances, keyed by ``"<device_name>/<relay_name>"`` for connection
+            tracking. Entries are dropped once their relay is collected. Use
+            ``Relay.wait_for_instance`` to wait for a relay not registered yet.
     """
 
-    INSTANCES: dict[str, "Relay"] = {}
+    ROUTES: tuple[tuple[str, str, list[str]], ...] = (("/is-on", "is_on", ["GET"]),)
+    POLLING_ROUTES: tuple[str, ...] = ("/is-on",)
+
+    # Ontology alignment
+    OWL_SUBCLASSES: tuple[str, ...] = ("https://w3id.org/saref#Switch",)
+
+    # Weak references, so the registry itself does not keep relays alive. Note that
+    # FastAPI's endpoint cache still holds routed components until it evicts them.
+    INSTANCES: WeakValueDictionary[str, Relay] = WeakValueDictionary()
+    _waiters: dict[str, list[asyncio.Future]] = {}
 
     def __init__(self, name: str, hw_device: FlowchemDevice) -> None:
         """
@@ -43,13 +57,40 @@ class Relay(PowerSwitch):
         """
         super().__init__(name, hw_device)
 
-        self.add_api_route("/is-on", self.is_on, methods=["GET"])
+        # Register instance globally for device-component tracking
+        self._register(f"{self.hw_device.name}/{self.name}", self)
+
+    @classmethod
+    def _register(cls, key: str, relay: Relay) -> None:
+        """Register a relay in ``INSTANCES`` and wake up the tasks waiting for it."""
+        cls.INSTANCES[key] = relay
+        for waiter in cls._waiters.pop(key, []):
+            if not waiter.done():
+                waiter.set_result(relay)
+
+    @classmethod
+    async def wait_for_instance(cls, key: str, timeout: float) -> Relay:
+        """
+        Return the relay registered as ``key``, waiting for its registration if needed.
 
-        # Ontology alignment
-        self.component_info.owl_subclass_of.append("https://w3id.org/saref#Switch")
+        Args:
+            key (str): Relay identifier, formatted as ``<device_name>/<relay_name>``.
+            timeout (float): Maximum waiting time in seconds.
 
-        # Register instance globally for device-component tracking
-        self.INSTANCES[self.hw_device.name + "/" + self.name] = self
+        Raises:
+            asyncio.TimeoutError: If the relay is not registered within ``timeout``.
+        """
+        if key in cls.INSTANCES:
+            return cls.INSTANCES[key]
+        # A future per waiter, created on the running loop, is resolved by _register()
+        waiter = asyncio.get_running_loop().create_future()
+        cls._waiters.setdefault(key, []).append(waiter)
+        try:
+            return await asyncio.wait_for(waiter, timeout)
+        finally:
+            pending = cls._waiters.get(key, [])
+            if waiter in pending:
+                pending.remove(waiter)
 
     async def power_on(self, **kwargs) -> bool:  # type: ignore[override]
         """
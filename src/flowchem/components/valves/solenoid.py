@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from flowchem.components.flowchem_component import FlowchemComponent
+from flowchem.components.state_cache import StateCache
 from flowchem.devices.flowchem_device import FlowchemDevice
 
 
@@ -23,15 +24,27 @@ class SolenoidValve(FlowchemComponent):
         Identifier name for the solenoid valve component.
     hw_device : FlowchemDevice
         The hardware device instance that controls the valve.
+
+    Notes
+    -----
+    Concurrent status requests are coalesced: while a query to the hardware is
+    in flight, further callers await the same result instead of issuing a new
+    command on the bus. The status is also cached for the `state_cache_ttl` of
+    the device, and `open`/`close` invalidate it.
     """
 
+    ROUTES: tuple[tuple[str, str, list[str]], ...] = (
+        ("/open", "open", ["PUT"]),
+        ("/close", "close", ["PUT"]),
+        ("/is_open", "is_open", ["GET"]),
+        ("/status", "get_status", ["GET"]),
+    )
+    POLLING_ROUTES: tuple[str, ...] = ("/is_open", "/status")
+
     def __init__(self, name: str, hw_device: FlowchemDevice) -> None:
 
         super().__init__(name, hw_device)
-        self.add_api_route("/open", self.open, methods=["PUT"])
-        self.add_api_route("/close", self.close, methods=["PUT"])
-        self.add_api_route("/is_open", self.is_open, methods=["GET"])
-        self.add_api_route("/status", self.get_status, methods=["GET"])
+        self._state_cache = StateCache(hw_device.state_cache_ttl)
 
     async def open(self):
         """
@@ -40,7 +53,10 @@ class SolenoidValve(FlowchemComponent):
         This method energises the solenoid if it is normally closed, or de-energises it if it is normally open, switching the valve to the
         'open' state, which allows flow through the channel.
         """
-        return await self.hw_device.open()  # type: ignore[attr-defined]
+        try:
+            return await self.hw_device.open()  # type: ignore[attr-defined]
+        finally:
+            self._state_cache.invalidate()
 
     async def close(self):
         """
@@ -49,7 +65,10 @@ class SolenoidValve(FlowchemComponent):
         This method de-energizes the solenoid, switching the valve to
         the "closed" state, stopping flow through the channel.
         """
-        return await self.hw_device.close()  # type: ignore[attr-defined]
+        try:
+            return await self.hw_device.close()  # type: ignore[attr-defined]
+        finally:
+            self._state_cache.invalidate()
 
     async def is_open(self) -> bool:
         """
@@ -60,7 +79,9 @@ class SolenoidValve(FlowchemComponent):
         bool
             `True` if the valve is open, `False` if closed.
         """
-        return await self.hw_device.is_open()  # type: ignore[attr-defined]
+        return await self._state_cache.get(
+            "status", self.hw_device.is_open  # type: ignore[attr-defined]
+        )
 
     async def get_status(self) -> bool:
         """Backward-compatible alias for checking whether the valve is open."""
@@ -74,32 +95,3 @@ class SolenoidValve2Way(SolenoidValve):
     This specialized class inherits from `SolenoidValve` and represents
     a standard 2-way configuration (one inlet, one outlet).
     """
-
-    async def open(self):
-        """
-        Open the solenoid valve.
-
-        This method energises the solenoid if it is normally closed, or de-energises it if it is normally open, switching the valve to the
-        'open' state, which allows flow through the channel.
-        """
-        return await self.hw_device.open()  # type: ignore[attr-defined]
-
-    async def close(self):
-        """
-        Close the solenoid valve.
-
-        This method de-energizes the solenoid, switching the valve to
-        the "closed" state, stopping flow through the channel.
-        """
-        return await self.hw_device.close()  # type: ignore[attr-defined]
-
-    async def is_open(self) -> bool:
-        """
-        Get the current valve status.
-
-        Returns
-        -------
-        bool
-            `True` if the valve is open, `False` if closed.
-        """
-        return await self.hw_device.is_open()  # type: ignore[attr-defined]
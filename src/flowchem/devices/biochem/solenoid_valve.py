@@ -1,9 +1,11 @@
 from __future__ import annotations
 from flowchem.devices.flowchem_device import FlowchemDevice
 from flowchem.components.device_info import DeviceInfo
+from flowchem.utils.exceptions import InvalidConfigurationError
 from flowchem.utils.people import samuel_saraiva
 from flowchem.components.valves.solenoid import SolenoidValve, SolenoidValve2Way
 
+from flowchem.components.technical.MultiChannels import MultiChannelRelay
 from flowchem.components.technical.relay import Relay
 
 from loguru import logger
@@ -49,11 +51,15 @@ class BioChemSolenoidValve(FlowchemDevice):
         ``<device_name>/<relay_name>``. Must correspond to a registered entry in
         ``Relay.INSTANCES``.
     channel : int, optional
-        Relay channel index (1–32) if the relay supports multiple channels.
+        Relay channel index if the relay supports multiple channels, checked
+        against the channels of the bound relay in ``initialize()``.
         Leave unset for single-channel relays.
     normally_open : bool, default True
         Defines the electrical/flow logic of the valve. If True, the valve is
         open by default (no power); if False, it is closed by default.
+    timeout : float, default 10
+        Maximum time, in seconds, to wait for the `support_platform` relay to be
+        registered during initialization.
 
     Attributes
     ----------
@@ -63,12 +69,16 @@ class BioChemSolenoidValve(FlowchemDevice):
         The bound relay instance controlling the valve channel.
     """
 
+    # Valve component registered by initialize(), overridden by the 2-way variant
+    _component_cls: type[SolenoidValve] = SolenoidValve
+
     def __init__(
         self,
         name: str,
         support_platform: str,  # device_name/relay_name ex: mpibox/relay-A
         channel: int | None = None,
         normally_open: bool = True,
+        timeout: float = 10,
     ):
 
         super().__init__(name)
@@ -76,9 +86,13 @@ class BioChemSolenoidValve(FlowchemDevice):
         self.support_platform = support_platform
 
         self.channel = channel
+        # Relay components take the channel as a label, convert it once here
+        self._channel = None if channel is None else str(channel)
 
         self.normally_open = normally_open
 
+        self.timeout = timeout
+
         self._io: Relay
 
         self.device_info = DeviceInfo(
@@ -91,29 +105,43 @@ class BioChemSolenoidValve(FlowchemDevice):
         """
         Bind the solenoid valve to the configured relay support platform.
 
-        This method polls ``Relay.INSTANCES`` for the configured `support_platform` name.
-        It checks every 0.5 seconds for up to ~3 seconds (6 attempts). Once the relay
-        instance is found, the valve component is registered and becomes operational.
+        This method waits for the configured `support_platform` to be registered in
+        ``Relay.INSTANCES``, for up to `timeout` seconds. The valve binds as soon as the
+        relay registers. Once the relay instance is found, the valve component is
+        registered and becomes operational.
 
         Raises
         ------
-        Exception
-            If no matching relay instance is found within the retry window.
+        InvalidConfigurationError
+            If no matching relay instance is registered within `timeout`, or if the
+            configured `channel` is not a channel of the bound relay.
         """
-        n = 0
-        while self.support_platform not in Relay.INSTANCES:
-            await asyncio.sleep(0.5)
-            n += 1
-            if n > 6:
-                raise Exception(
-                    f"The relay support_platform '{self.support_platform}' was not declared or initialized. "
-                    "The valve cannot be initialized without a support_platform "
-                    f"(Please add '{self.support_platform}' to the configuration file!)."
-                )
-
-        self._io = Relay.INSTANCES[self.support_platform]
+        try:
+            self._io = await Relay.wait_for_instance(
+                self.support_platform, self.timeout
+            )
+        except asyncio.TimeoutError as e:
+            raise InvalidConfigurationError(
+                f"The relay support_platform '{self.support_platform}' was not declared or initialized. "
+                "The valve cannot be initialized without a support_platform "
+                f"(Please add '{self.support_platform}' to the configuration file!)."
+            ) from e
+        if (
+            isinstance(self._io, MultiChannelRelay)
+            and self._channel not in self._io.channels
+        ):
+            raise InvalidConfigurationError(
+                f"The channel of the valve '{self.name}' should be one of the channels of "
+                f"'{self.support_platform}' ({', '.join(self._io.channels)}) - It was provided {self.channel}!"
+            )
+        # The relay action opening the valve depends on its configuration only, bind it once
+        self._do_open, self._do_close = (
+            (self._io.power_off, self._io.power_on)
+            if self.normally_open
+            else (self._io.power_on, self._io.power_off)
+        )
         # Register the standard SolenoidValve component/API on this device
-        self.components.append(SolenoidValve("valve", self))
+        self.components.append(self._component_cls("valve", self))
         conf_valve = "normally open" if self.normally_open else "normally closed"
         logger.info(
             f"Connected to BioChemSolenoidValve {conf_valve} on '{self.support_platform}' channel {self.channel}!"
@@ -131,12 +159,10 @@ class BioChemSolenoidValve(FlowchemDevice):
         -----
         - The relay channel index is specified by `self.channel`.
         - Behavior automatically inverts depending on the `normally_open` flag.
-        - This method delegates to the underlying relay’s ``power_on`` or ``power_off``.
+        - This method delegates to the underlying relay’s ``power_on`` or ``power_off``,
+          as selected in ``initialize()``.
         """
-        if self.normally_open:
-            return await self._io.power_off(channel=self.channel)
-        else:
-            return await self._io.power_on(channel=self.channel)
+        return await self._do_open(channel=self._channel)
 
     async def close(self):
         """
@@ -150,12 +176,10 @@ class BioChemSolenoidValve(FlowchemDevice):
         -----
         - The relay channel index is specified by `self.channel`.
         - Behavior automatically inverts depending on the `normally_open` flag.
-        - This method delegates to the underlying relay’s ``power_on`` or ``power_off``.
+        - This method delegates to the underlying relay’s ``power_on`` or ``power_off``,
+          as selected in ``initialize()``.
         """
-        if self.normally_open:
-            return await self._io.power_on(channel=self.channel)
-        else:
-            return await self._io.power_off(channel=self.channel)
+        return await self._do_close(channel=self._channel)
 
     async def is_open(self) -> bool:
         """
@@ -175,43 +199,11 @@ class BioChemSolenoidValve(FlowchemDevice):
           for a *normally open* valve, an ON relay means *closed*; for a *normally closed*
           valve, an ON relay means *open*.
         """
-        status = await self._io.is_on(channel=self.channel)
-        if self.normally_open:
-            return not status
-        else:
-            return status
+        status = await self._io.is_on(channel=self._channel)
+        return bool(status) != self.normally_open
 
 
 class BioChemSolenoid2WayValve(BioChemSolenoidValve):
+    """Bio-Chem 2-way solenoid valve, exposing the `SolenoidValve2Way` component API."""
 
-    async def initialize(self):
-        """
-        Bind the solenoid valve to the configured relay support platform.
-
-        This method polls ``Relay.INSTANCES`` for the configured `support_platform` name.
-        It checks every 0.5 seconds for up to ~3 seconds (6 attempts). Once the relay
-        instance is found, the valve component is registered and becomes operational.
-
-        Raises
-        ------
-        Exception
-            If no matching relay instance is found within the retry window.
-        """
-        n = 0
-        while self.support_platform not in Relay.INSTANCES:
-            await asyncio.sleep(0.5)
-            n += 1
-            if n > 6:
-                raise Exception(
-                    f"The relay support_platform '{self.support_platform}' was not declared or initialized. "
-                    "The valve cannot be initialized without a support_platform "
-                    f"(Please add '{self.support_platform}' to the configuration file!)."
-                )
-
-        self._io = Relay.INSTANCES[self.support_platform]
-        # Register the standard SolenoidValve component/API on this device
-        self.components.append(SolenoidValve2Way("valve", self))
-        conf_valve = "normally open" if self.normally_open else "normally closed"
-        logger.info(
-            f"Connected to BioChemSolenoidValve {conf_valve} on '{self.support_platform}' channel {self.channel}!"
-        )
+    _component_cls = SolenoidValve2Way
@@ -103,9 +103,13 @@ from flowchem.devices.custom.mpikg_switch_box_component import (
 )
 from flowchem.devices.flowchem_device import FlowchemDevice
 from flowchem.components.device_info import DeviceInfo
+from flowchem.components.state_cache import StateCache
 from flowchem.utils.people import samuel_saraiva
 
+from collections.abc import Sequence
+from contextlib import AsyncExitStack, asynccontextmanager
 from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from loguru import logger
 from enum import Enum
 import aioserial
@@ -126,17 +130,28 @@ DAC_BITS = 4096
 DAC_VOLTS = 10
 
 
-def bit_to_int(bits: list[int]) -> int:
-    return int("".join(str(b) for b in bits), 2)
+def word_to_channels(word: int) -> list[int]:
+    # Channel i+1 is the sum of its power1 (bit 8+i) and power2 (bit i) bits
+    return [(word >> (i + 8) & 1) + (word >> i & 1) for i in range(8)]
 
 
-def int_to_bit_list(value: int, length: int = 16) -> list[int]:
-    bits = list(
-        map(int, bin(value)[2:])
-    )  # convert to binary string, strip "0b", then to list of ints
-    if length is not None:  # pad with leading zeros if length is given
-        bits = [0] * (length - len(bits)) + bits
-    return bits
+def channels_to_word(values: Sequence[int]) -> int:
+    """
+    Bits are mapped as:
+    bits_power1: [ch8, ch7, ch6, ch5, ch4, ch3, ch2, ch1] (high byte of the word)
+    bits_power2: [ch8, ch7, ch6, ch5, ch4, ch3, ch2, ch1] (low byte of the word)
+    """
+    # Channels missing from a short list keep their bits at 0, no padding needed
+    bits_power1 = 0  # bit i → channel i+1
+    bits_power2 = 0
+    for i, v in enumerate(values):
+        if v == 2:
+            """Full power"""
+            bits_power1 |= 1 << i
+            bits_power2 |= 1 << i
+        elif v == 1:
+            bits_power1 |= 1 << i
+    return bits_power1 << BEFE_RELE_BITS // 2 | bits_power2
 
 
 class SwitchBoxException(Exception):
@@ -177,7 +192,19 @@ class BefrelayPorts(_StrEnum):
     START_D = "startd"
 
 
-@dataclass
+# Variables addressed per channel (e.g. "dac1"), built once instead of a set per command
+CHANNEL_VARIABLES = frozenset({VariableType.ADC.value, VariableType.DAC.value})
+
+# Ports holding 8 relay channels each, the only ones accepted by single-port commands
+RELAY_PORTS = frozenset(
+    p.value
+    for p in (BefrelayPorts.A, BefrelayPorts.B, BefrelayPorts.C, BefrelayPorts.D)
+)
+# Box-wide relay channel (1-32) → (port, channel index within the port 1-8)
+RELAY_CHANNELS = {c: ("abcd"[(c - 1) // 8], (c - 1) % 8 + 1) for c in range(1, 33)}
+
+
+@dataclass(slots=True, frozen=True)
 class SwitchBoxBeferelayCommand:
     """Class representing a box command for Beferelay Ports and its expected reply"""
 
@@ -188,21 +215,12 @@ class SwitchBoxBeferelayCommand:
     reply_lines: int = 1
 
     def compile(self) -> bytes:
-        command = ""
-        if self.request == InfRequest.SET:
-            if self.port == BefrelayPorts.ABCD:
-                command = f"{self.request} {self.port}:"
-                for bits in self.bits_command_list:
-                    command += f"{bits},"
-                command = command[:-1]
-            else:
-                command = f"{self.request} {self.port}:{self.bits_command}"
-        elif self.request == InfRequest.GET:
-            command = f"{self.request} {self.port}"
-        return f"{command}\r".encode()
+        return _compile_beferelay(
+            self.request, self.port, self.bits_command, tuple(self.bits_command_list)
+        )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SwitchBoxGeneralCommand:
     """Class representing a box command ADC/DAC Commands and its expected reply"""
 
@@ -216,17 +234,42 @@ class SwitchBoxGeneralCommand:
         """
         Create actual command byte by prepending box address to command.
         """
-        if self.request == InfRequest.SET:
-            if self.variable in {VariableType.ADC, VariableType.DAC}:
-                command = f"{self.request} {self.variable}{self.channel}:{self.value}"
-            else:
-                command = f"{self.request} {self.variable}:{self.value}"
+        return _compile_general(self.request, self.variable, self.channel, self.value)
+
+
+# Polling repeats the same few commands (e.g. "get abcd", "get adcx"), so the compiled
+# bytes are memoized on the command fields.
+@lru_cache(maxsize=256)
+def _compile_beferelay(
+    request: str, port: str, bits_command: int, bits_command_list: tuple[int, ...]
+) -> bytes:
+    command = ""
+    if request == InfRequest.SET:
+        if port == BefrelayPorts.ABCD:
+            payload = ",".join(str(bits) for bits in bits_command_list)
+            command = f"{request} {port}:{payload}"
         else:
-            if self.variable in {VariableType.ADC, VariableType.DAC}:
-                command = f"{self.request} {self.variable}{self.channel}"
-            else:
-                command = f"{self.request} {self.variable}"
-        return f"{command}\r".encode()
+            command = f"{request} {port}:{bits_command}"
+    elif request == InfRequest.GET:
+        command = f"{request} {port}"
+    return f"{command}\r".encode("ascii")
+
+
+@lru_cache(maxsize=256)
+def _compile_general(
+    request: str, variable: VariableType, channel: int | str, value: int
+) -> bytes:
+    if request == InfRequest.SET:
+        if variable in CHANNEL_VARIABLES:
+            command = f"{request} {variable}{channel}:{value}"
+        else:
+            command = f"{request} {variable}:{value}"
+    else:
+        if variable in CHANNEL_VARIABLES:
+            command = f"{request} {variable}{channel}"
+        else:
+            command = f"{request} {variable}"
+    return f"{command}\r".encode("ascii")
 
 
 class SwitchBoxIO:
@@ -250,6 +293,8 @@ class SwitchBoxIO:
         """
         self.lock = asyncio.Lock()
         self._serial = aio_port
+        # Receive buffer reused by every reply (only accessed under the lock)
+        self._rx_buf = bytearray()
 
     @classmethod
     def from_config(cls, port, **serial_kwargs):
@@ -271,7 +316,7 @@ class SwitchBoxIO:
     ):
         """Writes a command to the box"""
         command_compiled = command.compile()
-        logger.debug(f"Sending {command_compiled!r}")
+        logger.debug("Sending {!r}", command_compiled)
         try:
             await self._serial.write_async(command_compiled)
         except aioserial.SerialException as e:
@@ -280,23 +325,27 @@ class SwitchBoxIO:
     async def _read_reply(self, command) -> str:
         """Reads the box reply from serial communication"""
         logger.debug(
-            f"I am going to read {command.reply_lines} line for this command (+prompt)"
+            "I am going to read {} line for this command (+prompt)", command.reply_lines
         )
-        reply_string = ""
-
-        for line_num in range(
-            command.reply_lines + 2
-        ):  # +1 for leading newline character in reply + 1 for prompt
-            chunk = await self._serial.readline_async(200)
-            logger.debug(f"Read line: {repr(chunk)} ")
-            chunk = chunk.decode("ascii")
-            # Stripping newlines etc. allows to skip empty lines and clean output
-            chunk = chunk.strip()
-
-            if chunk:
-                reply_string += chunk
-
-        logger.debug(f"Reply received: {reply_string}")
+        # +1 for leading newline character in reply + 1 for prompt
+        n_lines = command.reply_lines + 2
+
+        # Read whatever is already buffered in one call, instead of one call per line.
+        # An empty read means the timeout expired, as with readline.
+        raw = self._rx_buf
+        raw.clear()
+        while raw.count(b"\n") < n_lines:
+            chunk = await self._serial.read_async(max(1, self._serial.in_waiting))
+            if not chunk:
+                break
+            raw += chunk
+        logger.opt(lazy=True).debug("Read: {!r} ", lambda: bytes(raw))
+
+        # Stripping newlines etc. allows to skip empty lines and clean output
+        lines = raw.decode("ascii").split("\n", n_lines)[:n_lines]
+        reply_string = "".join(line.strip() for line in lines)
+
+        logger.debug("Reply received: {}", reply_string)
         return reply_string
 
     def reset_buffer(self):
@@ -320,33 +369,55 @@ class SwitchBoxIO:
                 "No response received from box, check port address!"
             )
         if response.startswith("ERROR"):
-            logger.error(f"Error in the command '{command}' sent to the Switch Box")
+            logger.error("Error in the command '{}' sent to the Switch Box", command)
         return response
 
 
 class SwitchBoxMPIKG(FlowchemDevice):
     """Switch Box MPIKG module class"""
 
-    def __init__(self, box_io: SwitchBoxIO, name: str = "") -> None:
+    # DAC conversion factors, so that each conversion is a single multiplication
+    _DAC_BITS_PER_VOLT = DAC_BITS / DAC_VOLTS
+    _DAC_VOLTS_PER_BIT = DAC_VOLTS / DAC_BITS
+
+    def __init__(
+        self, box_io: SwitchBoxIO, name: str = "", state_cache_ttl: float = 0
+    ) -> None:
         super().__init__(name)
         self.box_io = box_io
+        self.state_cache_ttl = state_cache_ttl
+        # Port status shared by all the relay components (and valves) of the box
+        self._relay_status = StateCache(state_cache_ttl)
         self.device_info = DeviceInfo(
             authors=[samuel_saraiva],
             manufacturer="Custom",
             model="Custom",
         )
         self.low_power_after: dict[str, float] = {"a": -1, "b": -1, "c": -1, "d": -1}
+        # Pending switch to half power of each port, replaced by any later command on the port
+        self._low_power_tasks: dict[str, asyncio.Task] = {}
+        # Last word set on each relay port. The driver is the only master of the box, so
+        # single-channel commands can keep the other channels without querying them first.
+        self._port_words: dict[str, int] = {}
+        # Single-channel changes waiting to be merged into one command per port, with the
+        # task sending that command. A port lock serializes the merged commands, so
+        # changes arriving while a command is on the wire are batched into the next one.
+        self._channel_batches: dict[str, tuple[dict[int, int], asyncio.Task[bool]]] = {}
+        self._batch_locks = {port: asyncio.Lock() for port in RELAY_PORTS}
+        # Flush tasks of the batches, referenced until they are done
+        self._flush_tasks: set[asyncio.Task[bool]] = set()
 
     @classmethod
     def from_config(
         cls,
         port: str,
         name: str = "",
+        state_cache_ttl: float = 0,
         **serial_kwargs,
     ):
         switch_io = SwitchBoxIO.from_config(port, **serial_kwargs)
 
-        return cls(box_io=switch_io, name=name)
+        return cls(box_io=switch_io, name=name, state_cache_ttl=state_cache_ttl)
 
     async def initialize(self):
         self.device_info.version = await self.box_io.write_and_read_reply(
@@ -364,8 +435,9 @@ class SwitchBoxMPIKG(FlowchemDevice):
                 SwitchBoxRelay("relay-D", self, "d"),  # Channel 25 to 32
             ]
         )
+        self._port_words = dict(await self.get_relay_words())
 
-        logger.info(f"Connected to SwitchBoxMPIKG on port {self.box_io._serial.port}!")
+        logger.info("Connected to SwitchBoxMPIKG on port {}!", self.box_io._serial.port)
 
     """ Set to lower power appraoch """
 
@@ -379,16 +451,74 @@ class SwitchBoxMPIKG(FlowchemDevice):
         from full power (2) to half power (1) after the specified time.
         If the delay is set to 0 seconds, the feature is disabled.
 
+        The switch runs in the background: relay commands return as soon as the box
+        acknowledges them, and any later command on the port (or disabling the feature)
+        cancels the pending switch.
+
         Args:
             port (str): Port where this approach will be triggered
             switch_to_low_after (int): Delay time before switching to half power is seconds.
                 -1 mean turn this option off
         """
-        assert port in "a b c d".split()
+        assert port in RELAY_PORTS
         self.low_power_after[port] = switch_to_low_after
+        if switch_to_low_after <= 0:
+            self._cancel_low_power(port)
+
+    def _schedule_low_power(self, port: str, bits_command: int):
+        """Schedule the switch to half power of the full power channels of a port."""
+        if self.low_power_after[port] > 0 and bits_command & 0xFF:
+            self._low_power_tasks[port] = asyncio.create_task(
+                self._delayed_low_power(
+                    port, bits_command & 0xFF00, self.low_power_after[port]
+                )
+            )
+
+    def _cancel_low_power(self, port: str):
+        """Cancel the pending switch to half power of a port, if any."""
+        task = self._low_power_tasks.pop(port, None)
+        if task is not None:
+            task.cancel()
+
+    async def _delayed_low_power(self, port: str, bits_command: int, after: float):
+        """Wait `after` seconds, then set the port to `bits_command` (power2 bits cleared)."""
+        try:
+            await asyncio.sleep(after)
+            async with self._batch_locks[port]:
+                try:
+                    status = await self.box_io.write_and_read_reply(
+                        command=SwitchBoxBeferelayCommand(
+                            port=port, request=InfRequest.SET, bits_command=bits_command
+                        )
+                    )
+                except asyncio.CancelledError:
+                    # The command may have reached the box, the word of the port is unknown
+                    self._relay_status.invalidate()
+                    self._port_words.pop(port, None)
+                    raise
+        finally:
+            if self._low_power_tasks.get(port) is asyncio.current_task():
+                del self._low_power_tasks[port]
+        self._relay_status.invalidate()
+        self._set_port_word(port, bits_command, status)
+        if not status.startswith("OK"):
+            logger.error(
+                "Port {} of {} failed to switch to half power!", port, self.name
+            )
 
     """ Port Befehle """
 
+    def _set_port_word(self, port: str, bits_command: int, status: str):
+        """Record the word set on a port, or forget it if the box did not acknowledge it."""
+        if status.startswith("OK"):
+            self._port_words[port] = bits_command
+        else:
+            self._port_words.pop(port, None)
+
+    def invalidate_port_cache(self):
+        """Forget the last word set on each port, e.g. after the box was reset."""
+        self._port_words.clear()
+
     async def set_relay_port(self, values: list[int], port: str = "a"):
         """Set all 8 relay channels of a given port.
 
@@ -410,52 +540,109 @@ class SwitchBoxMPIKG(FlowchemDevice):
 
         # verify port
         port = port.lower()
-        if port not in [p.value for p in BefrelayPorts]:
-            logger.error(f"There is not port {port} in device {self.name}!")
+        if port not in RELAY_PORTS:
+            logger.error("There is not port {} in device {}!", port, self.name)
             return False
+        # Pending single-channel batches must not overwrite this word
+        async with self._batch_locks[port]:
+            return await self._set_relay_port(values, port)
+
+    async def _set_relay_port(self, values: list[int], port: str) -> bool:
+        """`set_relay_port`, with the port validated and its batch lock already held."""
         if len(values) > 8:
-            logger.error(f"Port only have 8 channels - It was provide {len(values)}!")
+            logger.error("Port only have 8 channels - It was provide {}!", len(values))
             return False
-        while len(values) < 8:
-            values.append(0)
 
-        """
-        Bits are mapped as:
-        bits_power1: [ch8, ch7, ch6, ch5, ch4, ch3, ch2, ch1]
-        bits_power2: [ch8, ch7, ch6, ch5, ch4, ch3, ch2, ch1]
-        """
-        bits_power1 = [0] * int(BEFE_RELE_BITS / 2)  # channels 8 to 1
-        bits_power2 = [0] * int(BEFE_RELE_BITS / 2)  # channels 8 to 1
-        for i, v in enumerate(values):
-            if v == 2:
-                """Full power"""
-                bits_power1[-(i + 1)] = 1
-                bits_power2[-(i + 1)] = 1
-            elif v == 1:
-                bits_power1[-(i + 1)] = 1
-
-        bits_command = bit_to_int(bits_power1 + bits_power2)
+        bits_command = channels_to_word(values)
 
+        # This command supersedes the switch to half power scheduled by the previous one
+        self._cancel_low_power(port)
         status = await self.box_io.write_and_read_reply(
             command=SwitchBoxBeferelayCommand(
                 port=port, request=InfRequest.SET, bits_command=bits_command
             )
         )
+        self._relay_status.invalidate()
+        self._set_port_word(port, bits_command, status)
         if not status.startswith("OK"):
             return False
-        if self.low_power_after[port] > 0:
-            for i, v in enumerate(values):
-                if bits_power2[-(i + 1)] == 1:
-                    bits_power2[-(i + 1)] = 0
-            await asyncio.sleep(self.low_power_after[port])
+        self._schedule_low_power(port, bits_command)
+        return True
+
+    async def set_relay_ports(
+        self, values: dict[str, list[int]], switch_to_low_after: float | None = None
+    ) -> bool:
+        """Set the relay channels of several ports with a single command.
 
-        bits_command = bit_to_int(bits_power1 + bits_power2)
+        Args:
+            values (dict[str, list[int]]): Mapping of port IDs ("a", "b", "c", "d") to
+                lists of up to 8 channel states (0, 1, or 2), as in `set_relay_port`.
+                Ports missing from the mapping keep their current state, at least one
+                port must be given.
+            switch_to_low_after (float, optional): If given, the delay in seconds of the
+                switch to half power of the given ports, as in `set_lower_power_approach`
+                (-1 turns it off). By default, the ports keep their current setting.
+
+        Returns:
+            bool: True if the device acknowledged the command with "OK",
+            False otherwise.
+        """
+        async with self._all_ports_locked():
+            return await self._set_relay_ports(values, switch_to_low_after)
+
+    @asynccontextmanager
+    async def _all_ports_locked(self):
+        """Hold the batch locks of all the ports, the "set abcd" command rewrites them all."""
+        async with AsyncExitStack() as stack:
+            for port in "abcd":  # always in the same order
+                await stack.enter_async_context(self._batch_locks[port])
+            yield
+
+    async def _set_relay_ports(
+        self, values: dict[str, list[int]], switch_to_low_after: float | None = None
+    ) -> bool:
+        """`set_relay_ports`, with the batch locks of all the ports already held."""
+        ports = {port.lower(): states for port, states in values.items()}
+        if not ports:
+            logger.error("No port to set in device {}!", self.name)
+            return False
+        for port, states in ports.items():
+            if port not in RELAY_PORTS:
+                logger.error("There is not port {} in device {}!", port, self.name)
+                return False
+            if len(states) > 8:
+                logger.error(
+                    "Port only have 8 channels - It was provide {}!", len(states)
+                )
+                return False
+        if switch_to_low_after is not None:
+            for port in ports:
+                self.low_power_after[port] = switch_to_low_after
+
+        words = {port: channels_to_word(states) for port, states in ports.items()}
+        # The command sets all the ports, resend the last word of the others
+        if any(p not in words and p not in self._port_words for p in "abcd"):
+            self._port_words.update(await self.get_relay_words())
+        for port in "abcd":
+            words.setdefault(port, self._port_words[port])
+
+        for port in ports:
+            self._cancel_low_power(port)
         status = await self.box_io.write_and_read_reply(
             command=SwitchBoxBeferelayCommand(
-                port=port, request=InfRequest.SET, bits_command=bits_command
+                port=BefrelayPorts.ABCD,
+                request=InfRequest.SET,
+                bits_command_list=[words[p] for p in "abcd"],
             )
         )
-        return status.startswith("OK")
+        self._relay_status.invalidate()
+        for port in "abcd":
+            self._set_port_word(port, words[port], status)
+        if not status.startswith("OK"):
+            return False
+        for port in ports:
+            self._schedule_low_power(port, words[port])
+        return True
 
     async def set_relay_single_channel(
         self,
@@ -463,6 +650,7 @@ class SwitchBoxMPIKG(FlowchemDevice):
         value: int = 2,
         keep_port_status=True,
         port_identify: str = "a",
+        refresh: bool = False,
     ):
         """
         Set a single relay channel.
@@ -481,62 +669,164 @@ class SwitchBoxMPIKG(FlowchemDevice):
                 channels in the same port. If False, all other channels are reset
                 to 0. Default = True.
             port_identify (float, optional): port of the relay
+            refresh (bool, optional): If True, query the state of the other channels from
+                the box instead of using the last state set on the port. Default = False.
 
         Returns:
             bool: True if the command succeeded, False otherwise.
         """
-        ch = channel
-        if channel > 8:
-            if 8 < channel <= 16 and port_identify == "b":
-                ch = channel - 8
-            elif 16 < channel <= 24 and port_identify == "c":
-                ch = channel - 16
-            elif 24 < channel <= 32 and port_identify == "d":
-                ch = channel - 24
+        port_identify = port_identify.lower()
+        if port_identify not in RELAY_PORTS:
+            logger.error("There is not port {} in device {}!", port_identify, self.name)
+            return False
+        port, ch = RELAY_CHANNELS.get(channel, ("", 0))
+        # Channels 1-8 are also accepted as the local index on any port
+        if not ch or (channel > 8 and port != port_identify):
+            logger.error(
+                "There is not channel {} in device {} at port identify as 'Port-{}'!",
+                channel,
+                self.name,
+                port_identify,
+            )
+            return False
+
+        if keep_port_status and not refresh:
+            return await self._submit_channel(port_identify, ch, value)
+
+        async with self._batch_locks[port_identify]:
+            if keep_port_status:
+                word = (await self.get_relay_words())[port_identify]
+                values = word_to_channels(word)
             else:
-                logger.error(
-                    f"There is not channel {channel} in device {self.name} at port identify as "
-                    f"'Port-{port_identify}'!"
-                )
-                return False
+                values = [0] * 8
+            values[ch - 1] = value
+            return await self._set_relay_port(values, port_identify)
 
-        status = await self.get_relay_channels()
-        values = status[port_identify] if keep_port_status else [0] * 8
-        values[ch - 1] = value
+    async def set_relay_channels(self, values: dict[int, int]) -> bool:
+        """
+        Set several relay channels, on any ports, with a single command.
+
+        The other channels keep their state.
 
-        if self.low_power_after[port_identify.lower()] > 0 and value == 2:
-            if await self.set_relay_port(values=values, port=port_identify.lower()):
-                await asyncio.sleep(self.low_power_after[port_identify.lower()])
-                values[ch - 1] = 1
-                return await self.set_relay_port(
-                    values=values, port=port_identify.lower()
+        Args:
+            values (dict[int, int]): Mapping of box-wide channel indexes (1–32) to their
+                desired state (0=off, 1=half power, 2=full power).
+
+        Returns:
+            bool: True if the command succeeded, False otherwise.
+        """
+        for channel, value in values.items():
+            if channel not in RELAY_CHANNELS or value not in (0, 1, 2):
+                logger.error(
+                    "Invalid state {} for channel {} in device {}!",
+                    value,
+                    channel,
+                    self.name,
                 )
-            else:
                 return False
-        else:
-            return await self.set_relay_port(values=values, port=port_identify.lower())
 
-    async def get_relay_channels(self):
+        if not values:
+            return True
+        # Pending single-channel batches must not overwrite the words read here
+        async with self._all_ports_locked():
+            ports: dict[str, list[int]] = {}
+            for channel, value in values.items():
+                port, ch = RELAY_CHANNELS[channel]
+                if port not in ports:
+                    word = self._port_words.get(port)
+                    if word is None:
+                        word = (await self.get_relay_words())[port]
+                    ports[port] = word_to_channels(word)
+                ports[port][ch - 1] = value
+            return await self._set_relay_ports(ports)
+
+    async def _submit_channel(self, port: str, ch: int, value: int) -> bool:
+        """Queue a channel change, concurrent changes on the port share one command."""
+        batch = self._channel_batches.get(port)
+        if batch is None:
+            changes: dict[int, int] = {}
+            task = asyncio.create_task(self._flush_channels(port, changes))
+            self._flush_tasks.add(task)
+            task.add_done_callback(partial(self._flush_done, port))
+            batch = self._channel_batches[port] = (changes, task)
+        batch[0][ch] = value
+        # A cancelled caller must not cancel the command of the other ones. The task
+        # passes its result, exception or cancellation on to every caller of the batch.
+        return await asyncio.shield(batch[1])
+
+    async def _flush_channels(self, port: str, changes: dict[int, int]) -> bool:
+        """Send the queued channel changes of a port as a single `set_relay_port`."""
+        async with self._batch_locks[port]:
+            # Close the batch, later changes are sent by the next command
+            del self._channel_batches[port]
+            word = self._port_words.get(port)
+            if word is None:
+                word = (await self.get_relay_words())[port]
+            values = word_to_channels(word)
+            for ch, value in changes.items():
+                values[ch - 1] = value
+            # Nothing to change, unless the command has to (re)start the low power timer
+            if channels_to_word(values) == word and self.low_power_after[port] <= 0:
+                return True
+            return await self._set_relay_port(values, port)
+
+    def _flush_done(self, port: str, task: asyncio.Task[bool]):
+        """Release a finished flush task, closing its batch if it was cancelled early."""
+        self._flush_tasks.discard(task)
+        batch = self._channel_batches.get(port)
+        if batch is not None and batch[1] is task:
+            # Cancelled before taking the lock, later changes must not join this batch
+            del self._channel_batches[port]
+
+    async def get_relay_words(self) -> dict[str, int]:
         """
-        Query the current relay status of all ports.
+        Query the raw relay status word of all ports.
+
+        Concurrent queries share a single serial transaction, and the status is cached
+        for `state_cache_ttl` seconds. Any relay command invalidates it.
 
         Returns:
-            dict[str, list[int]]: Mapping of port IDs ("a", "b", "c", "d") to
-            lists of 8 integers (0, 1, 2) describing each channel state.
+            dict[str, int]: Mapping of port IDs ("a", "b", "c", "d") to the 16-bit
+            status word of the port - bit 8+i is the power1 bit and bit i the power2
+            bit of channel i+1, so that the channel state is their sum.
         """
+        return await self._relay_status.get("abcd", self._read_relay_words)
+
+    async def _read_relay_words(self) -> dict[str, int]:
         asw = await self.box_io.write_and_read_reply(
             command=SwitchBoxBeferelayCommand(
                 port=BefrelayPorts.ABCD, request=InfRequest.GET
             )
         )
-        asw = asw.replace(" ", "")
-        result = {}
-        for ports in asw.split(","):
-            bits_command = int_to_bit_list(int(ports.split(":")[1]))
-            result[ports.split(":")[0].lower()] = [
-                a + b for a, b in zip(bits_command[:8], bits_command[8:])
-            ][::-1]
-        return result
+        pairs = (item.split(":", 1) for item in asw.replace(" ", "").split(","))
+        return {port.lower(): int(word) for port, word in pairs}
+
+    async def get_relay_bitmap(self) -> int:
+        """
+        Query whether each of the 32 relay channels is on, as a single integer.
+
+        Returns:
+            int: 32-bit mask where bit i is set if channel i+1 is on (half or full power).
+        """
+        words = await self.get_relay_words()
+        bitmap = 0
+        for shift, port in enumerate("abcd"):
+            word = words[port]
+            bitmap |= ((word >> 8 | word) & 0xFF) << (8 * shift)
+        return bitmap
+
+    async def get_relay_channels(self):
+        """
+        Query the current relay status of all ports.
+
+        Returns:
+            dict[str, list[int]]: Mapping of port IDs ("a", "b", "c", "d") to
+            lists of 8 integers (0, 1, 2) describing each channel state.
+        """
+        return {
+            port: word_to_channels(word)
+            for port, word in (await self.get_relay_words()).items()
+        }
 
     """ ADC/DAC Commands """
 
@@ -553,13 +843,11 @@ class SwitchBoxMPIKG(FlowchemDevice):
                 channel="x", request=InfRequest.GET, variable=VariableType.ADC
             )
         )
-        asw = asw.replace(" ", "")
-        result = {}
-        for ports in asw.split(";"):
-            value = float(ports.split(":")[1])
-            channel = ports.split(":")[0].lower().removeprefix("adc")
-            result[f"ADC{channel}"] = value
-        return result
+        pairs = (item.split(":", 1) for item in asw.replace(" ", "").split(";"))
+        return {
+            f"ADC{channel.lower().removeprefix('adc')}": float(value)
+            for channel, value in pairs
+        }
 
     async def get_dac(self, channel: int = 1, volts: bool = True):
         """
@@ -580,14 +868,16 @@ class SwitchBoxMPIKG(FlowchemDevice):
         )
         bit = int(asw.split(":")[-1])
         if volts:
-            return bit / DAC_BITS * DAC_VOLTS
+            return bit * self._DAC_VOLTS_PER_BIT
+        return bit
 
-    async def set_dac(self, value: Quantity, channel: int = 1) -> bool:
+    async def set_dac(self, value: Quantity | float, channel: int = 1) -> bool:
         """
         Set the DAC output voltage for a given channel.
 
         Args:
-            value (Quantity): Target voltage as a Pint Quantity (e.g., `ureg("2.5 V")`).
+            value (Quantity | float): Target voltage as a Pint Quantity (e.g., `ureg("2.5 V")`)
+                or as a number of volts.
             channel (int, optional): DAC channel index (1 or 2). Defaults to 1.
 
         Returns:
@@ -599,7 +889,7 @@ class SwitchBoxMPIKG(FlowchemDevice):
             - The voltage is converted to volts and must be strictly between 0 V and 5 V.
             - If the voltage is out of range, an error is logged.
         """
-        volts = value.to("V").magnitude
+        volts = value.m_as("V") if hasattr(value, "m_as") else float(value)
         if not 0 < volts < 5:
             logger.error("The value set in the DAC should be between 0 and 5 V!")
             return False
@@ -608,7 +898,7 @@ class SwitchBoxMPIKG(FlowchemDevice):
                 channel=channel,
                 request=InfRequest.SET,
                 variable=VariableType.DAC,
-                value=int(volts * DAC_BITS / DAC_VOLTS),
+                value=int(volts * self._DAC_BITS_PER_VOLT),
             )
         )
         return status.startswith("OK")
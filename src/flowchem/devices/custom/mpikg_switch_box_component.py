@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
-from pint.errors import UndefinedUnitError, DimensionalityError
+from pint.errors import PintError
+
 from flowchem.components.technical.MultiChannels import (
     MultiChannelADC,
     MultiChannelDAC,
@@ -17,13 +19,22 @@ if TYPE_CHECKING:
     from .mpikg_switch_box import SwitchBoxMPIKG
 
 
-class SwitchBoxDAC(MultiChannelDAC):
+# ASCII digit → its value, any other byte → 0xFF (rejected)
+_DIGITS = bytes(i - 0x30 if 0x30 <= i <= 0x39 else 0xFF for i in range(256))
 
-    def __init__(self, name: str, hw_device: "SwitchBoxMPIKG"):
+# Relay channel state labels → state (0 off, 1 half power, 2 full power)
+_RELAY_STATES = {"0": 0, "1": 1, "2": 2}
 
-        super().__init__(name=name, hw_device=hw_device)
 
-        self.hw_device: SwitchBoxMPIKG
+# Delays repeat (e.g. "1 s", "0 s"), so parsed values are memoized by their string
+@lru_cache(maxsize=64)
+def _seconds_from_str(value: str) -> float:
+    return ureg.Quantity(value).m_as("s")
+
+
+class SwitchBoxDAC(MultiChannelDAC):
+
+    hw_device: SwitchBoxMPIKG
 
     async def read(self, channel: str) -> float:  # type: ignore[override]
         """
@@ -35,7 +46,10 @@ class SwitchBoxDAC(MultiChannelDAC):
         Returns:
             float: DAC output in volts.
         """
-        return await self.hw_device.get_dac(channel=int(channel), volts=True)
+        idx = self._ch_idx.get(str(channel))
+        if idx is None:
+            raise AttributeError(f"There is no channel '{channel}' in DAC ports!")
+        return await self.hw_device.get_dac(channel=idx + 1, volts=True)
 
     async def set(self, channel: str = "1", value: str = "0 V") -> bool:  # type: ignore[override]
         """
@@ -54,39 +68,46 @@ class SwitchBoxDAC(MultiChannelDAC):
                 - False if the channel argument is invalid or if the value cannot be parsed.
 
         Notes:
-            - The channel must be convertible to an integer.
+            - The channel must be one of the DAC channel labels ("1", "2").
             - The voltage string is parsed using the unit registry (`ureg`).
             - Any parsing or hardware errors are logged via `logger`.
         """
-        if not channel.isdigit():
+        idx = self._ch_idx.get(str(channel))
+        if idx is None:
             logger.error(
-                "The argument channel of the DAC should be a digit (1, 2, ...)"
+                "The argument channel of the DAC should be one of {}",
+                list(self._ch_idx),
             )
             return False
         try:
-            volts = ureg(value)
-        except (UndefinedUnitError, DimensionalityError, Exception) as e:
-            logger.error(f"Invalid DAC value '{value}' for channel {channel}: {e}")
+            volts = self._parse_volts(value)
+        except (PintError, ValueError) as e:
+            logger.error("Invalid DAC value '{}' for channel {}: {}", value, channel, e)
             return False
         return await self.hw_device.set_dac(  # type: ignore[call-arg]
-            channel=int(channel), value=volts
+            channel=idx + 1, value=volts
         )
 
 
 class SwitchBoxADC(MultiChannelADC):
 
+    hw_device: SwitchBoxMPIKG
+
+    _channels = frozenset(str(i) for i in range(1, 9))
+
     async def read(self, channel: str) -> float:  # type: ignore[override]
         """
         Read ADC (Analog-to-Digital Converter) channel (1 to 8).
 
+        The channel is taken from the reply of `read_all`, so that concurrent reads
+        of any channels share one transaction.
+
         Returns:
             voltage value in volts.
         """
-        asw = await self.read_all()
-        value = asw.get(f"ADC{channel}")
-        if value is not None:
-            return value
-        raise AttributeError(f"There is no channel '{channel} in ADC ports!'")
+        if str(channel) not in self._channels:
+            raise AttributeError(f"There is no channel '{channel} in ADC ports!'")
+        return (await self.read_all())[f"ADC{channel}"]
 
     async def read_all(self) -> dict[str, float]:
         """
@@ -96,8 +117,8 @@ class SwitchBoxADC(MultiChannelADC):
             dict[str, float]: Mapping of channel IDs (e.g. "ADC1", "ADC2") to measured
             voltage values in volts.
         """
-        self.hw_device: SwitchBoxMPIKG
-        return await self.hw_device.get_adc()
+        # Overlapping polls (e.g. `/read_all` and `/read_all_raw`) share one transaction
+        return await self._state_cache.get("all", self.hw_device.get_adc)
 
 
 class SwitchBoxRelay(MultiChannelRelay):
@@ -125,18 +146,29 @@ class SwitchBoxRelay(MultiChannelRelay):
         identify (str): Port identifier ("a", "b", "c", or "d").
     """
 
-    def __init__(self, name: str, hw_device: "SwitchBoxMPIKG", identify: str):
-        super().__init__(name=name, hw_device=hw_device)
-        self.hw_device: SwitchBoxMPIKG
-        self.identify = identify  # Port identifier ("a", "b", "c", or "d")
+    hw_device: SwitchBoxMPIKG
 
-        self.add_api_route(
-            "/lower_power_approach", self.set_lower_power_approach, methods=["PUT"]
-        )
+    ROUTES: tuple[tuple[str, str, list[str]], ...] = (
+        ("/lower_power_approach", "set_lower_power_approach", ["PUT"]),
+        ("/channel_set_point", "read_channel_set_point", ["GET"]),
+        ("/channels_set_point_mask", "read_channels_set_point_mask", ["GET"]),
+    )
+    # Routes setting all the ports of the box, only registered on the component of port "a"
+    BOX_ROUTES: tuple[tuple[str, str, list[str]], ...] = (
+        ("/channels", "switch_all_ports", ["PUT"]),
+    )
 
-        self.add_api_route(
-            "/channel_set_point", self.read_channel_set_point, methods=["GET"]
-        )
+    def __init__(self, name: str, hw_device: "SwitchBoxMPIKG", identify: str):
+        self.identify = identify  # Port identifier ("a", "b", "c", or "d")
+        if identify == "a":
+            self._route_table = self._route_table + self.BOX_ROUTES
+        super().__init__(name=name, hw_device=hw_device)
+        # Also accept the box-wide channel numbers of this port (e.g. "9".."16" on port b)
+        offset = 8 * "abcd".index(identify)
+        if offset:
+            self._ch_idx.update({str(i + offset): i - 1 for i in range(1, 9)})
+        # Channel label → bit of the channel in the box-wide relay bitmap
+        self._ch_bit = {ch: 1 << (offset + idx) for ch, idx in self._ch_idx.items()}
 
     async def power_on(self, channel: str = "1") -> bool:  # type: ignore[override]
         """
@@ -172,7 +204,16 @@ class SwitchBoxRelay(MultiChannelRelay):
 
     async def is_on(self, channel: str = "1") -> bool:  # type: ignore[override]
         """Check whether a relay channel is currently active."""
-        return await super().is_on(channel)
+        bit = self._ch_bit.get(str(channel))
+        if bit is None:
+            raise AttributeError(
+                f"The component {self.name} from {self.hw_device.name} has not channel: {channel}!!"
+            )
+        # All the channels share one read of the box bitmap, no per-port list is built.
+        # The device caches the relay status and every relay command invalidates it, so
+        # it is not cached again here.
+        bitmap = await self.hw_device.get_relay_bitmap()
+        return bool(bitmap & bit)
 
     async def switch_multiple_channel(self, values: str) -> bool:
         """
@@ -192,10 +233,52 @@ class SwitchBoxRelay(MultiChannelRelay):
         Returns:
             bool: True if the device acknowledged the command, False otherwise.
         """
-        return await self.hw_device.set_relay_port(
-            values=[int(c) for c in values], port=self.identify
+        states = self._port_states(values)
+        return await self.hw_device.set_relay_port(values=states, port=self.identify)
+
+    async def switch_all_ports(
+        self, ports: dict[str, str], switch_to_low_after: str | None = None
+    ) -> bool:
+        """
+        Set the relay states of the channels on several ports with a single command.
+
+        Exposed as `PUT /channels` on the component of port "a" only.
+
+        Args:
+            ports (dict[str, str]): Mapping of port IDs ("a", "b", "c", "d") to their
+                channel states, in the format of `switch_multiple_channel`.
+                Example: {"a": "00120001", "c": "2"}, ports "b" and "d" are kept.
+            switch_to_low_after (str, optional): Delay time before switching the given
+                ports to half power, as in `set_lower_power_approach` (e.g. "1 s", "0 s"
+                to disable). By default, the ports keep their current setting.
+
+        Returns:
+            bool: True if the device acknowledged the command, False otherwise.
+        """
+        states = {port: self._port_states(values) for port, values in ports.items()}
+        if switch_to_low_after is None:
+            return await self.hw_device.set_relay_ports(states)
+        delay = _seconds_from_str(switch_to_low_after)
+        return await self.hw_device.set_relay_ports(
+            states, switch_to_low_after=delay if delay > 0 else -1
         )
 
+    @staticmethod
+    def _port_states(values: str) -> list[int]:
+        """Convert a string of channel states (e.g. "00010012") to a list of ints."""
+        if len(values) > 8:
+            logger.warning(
+                "Port only have 8 channels - The states after '{}' are ignored!",
+                values[:8],
+            )
+        # One C-level pass over the bytes, missing channels are left off by set_relay_port
+        states = values[:8].encode("ascii").translate(_DIGITS)
+        if 0xFF in states:
+            raise ValueError(
+                f"Channel states must be digits - It was provide '{values}'!"
+            )
+        return list(states)
+
     async def read_channel_set_point(self, channel: str = "1") -> int | None:
         """
         Read the current state of a specific relay channel.
@@ -213,25 +296,18 @@ class SwitchBoxRelay(MultiChannelRelay):
                 - 0, 1, or 2 → Valid relay state.
                 - None → If the channel index is invalid or not part of this port.
         """
-        ch = int(channel)
-        if not 0 < ch <= 8:
+        idx = self._ch_idx.get(str(channel))
+        if idx is None:
             logger.error(
-                f"There is not channel {ch} in device {self.name} at port-{self.identify}!"
+                "There is not channel {} in device {} at port-{}!",
+                channel,
+                self.hw_device.name,
+                self.identify,
             )
             return None
-        if ch > 8:
-            if 8 < ch <= 16 and self.identify == "b":
-                ch = ch - 8
-            elif 16 < ch <= 24 and self.identify == "c":
-                ch = ch - 16
-            elif 24 < ch <= 32 and self.identify == "d":
-                ch = ch - 24
-            logger.error(
-                f"There is not channel {ch} in device {self.hw_device.name} at port-{self.identify}!"
-            )
-            return None
-        asw = await self.hw_device.get_relay_channels()
-        return asw[self.identify][ch - 1]
+        # Decode only this channel from the (shared, cached) status word of the port
+        word = (await self.hw_device.get_relay_words())[self.identify]
+        return (word >> (idx + 8) & 1) + (word >> idx & 1)
 
     async def read_channels_set_point(self) -> list[int]:
         """
@@ -249,6 +325,25 @@ class SwitchBoxRelay(MultiChannelRelay):
         asw = await self.hw_device.get_relay_channels()
         return asw[self.identify]
 
+    async def read_channels_set_point_mask(self) -> int:
+        """
+        Read the current states of all 8 channels on the current port as one 16-bit word.
+
+        This is the raw port status of the device: a single integer instead of a list,
+        for clients polling the relays at a high rate.
+
+        Bits are mapped as:
+            * bit 8+i → power1 of channel i+1
+            * bit i   → power2 of channel i+1
+
+        The state of channel i+1 is `((mask >> (8 + i)) & 1) + ((mask >> i) & 1)`.
+
+        Returns:
+            int: Status word of this port.
+        """
+        words = await self.hw_device.get_relay_words()
+        return words[self.identify]
+
     async def set_lower_power_approach(self, switch_to_low_after: str = "1 s"):
         """
         Configure automatic switching from full power to half power after a delay.
@@ -262,7 +357,7 @@ class SwitchBoxRelay(MultiChannelRelay):
                 Example: "1 s", "500 ms", "2 s".
                 Use "0 s" to disable automatic reduction.
         """
-        value: float = ureg.Quantity(switch_to_low_after).to("s").magnitude
+        value = _seconds_from_str(switch_to_low_after)
         if value > 0:
             return await self.hw_device.set_lower_power_approach(
                 port=self.identify, switch_to_low_after=value
@@ -293,9 +388,26 @@ class SwitchBoxRelay(MultiChannelRelay):
         Returns:
             bool: True if the device acknowledged the command, False otherwise.
         """
+        idx = self._ch_idx.get(str(channel))
+        if idx is None:
+            logger.error(
+                "There is not channel {} in device {} at port-{}!",
+                channel,
+                self.hw_device.name,
+                self.identify,
+            )
+            return False
+        state = _RELAY_STATES.get(value)
+        if state is None:
+            logger.error(
+                "Invalid state '{}' for channel {} - It should be 0, 1 or 2!",
+                value,
+                channel,
+            )
+            return False
         return await self.hw_device.set_relay_single_channel(
-            channel=int(channel),
-            value=int(value),
+            channel=idx + 1,
+            value=state,
             keep_port_status=keep_port_status,
             port_identify=self.identify,
         )
@@ -18,8 +18,14 @@ class FlowchemDevice(ABC):
 
     All hardware-control classes must subclass this to signal they are flowchem-device and be enabled for initialization
     during config parsing.
+
+    Attributes:
+        state_cache_ttl: Time (in seconds) for which components may serve states read from the hardware from memory.
+            0 (default) disables the cache, so that every read reaches the hardware.
     """
 
+    state_cache_ttl: float = 0
+
     def __init__(self, name) -> None:
         """All device have a name, which is the key in the config dict thus unique."""
         self.name = name
@@ -102,6 +102,9 @@ class DADChannelControl(PhotoSensor):
 
     hw_device: KnauerDAD
 
+    # Ontology: diode array detector
+    OWL_SUBCLASSES: tuple[str, ...] = ("http://purl.obolibrary.org/obo/CHMO_0002503",)
+
     def __init__(self, name: str, hw_device: KnauerDAD, channel: int) -> None:
         """
         Initialize the DADChannelControl component.
@@ -123,11 +126,6 @@ class DADChannelControl(PhotoSensor):
         )
         self.add_api_route("/set-bandwidth", self.set_bandwidth, methods=["PUT"])
 
-        # Ontology: diode array detector
-        self.component_info.owl_subclass_of.append(
-            "http://purl.obolibrary.org/obo/CHMO_0002503",
-        )
-
     async def acquire_signal(self) -> float:
         """
         Acquire a signal from the sensor.
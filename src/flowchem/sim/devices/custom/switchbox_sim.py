@@ -113,9 +113,17 @@ class SwitchBoxMPIKGSim(SwitchBoxMPIKG):
 
     @classmethod
     def from_config(
-        cls, port: str = "SIM", name: str = "", **serial_kwargs
+        cls,
+        port: str = "SIM",
+        name: str = "",
+        state_cache_ttl: float = 0,
+        **serial_kwargs,
     ) -> "SwitchBoxMPIKGSim":
         sim_io = SimulatedSwitchBoxIO()
-        instance = cls(box_io=sim_io, name=name or "sim-switchbox")
+        instance = cls(
+            box_io=sim_io,
+            name=name or "sim-switchbox",
+            state_cache_ttl=state_cache_ttl,
+        )
         instance.sim_io = sim_io
         return instance
@@ -149,8 +149,130 @@ class TestBioChemSolenoid2WayValveSim:
     async def test_initializes_one_component(self, solenoid_2way):
         assert len(solenoid_2way.components) == 1
 
+    async def test_component_routes(self, solenoid_2way):
+        from fastapi import FastAPI
+        from httpx import ASGITransport, AsyncClient
+
+        from flowchem.components.valves.solenoid import SolenoidValve2Way
+
+        component = solenoid_2way.components[0]
+        assert isinstance(component, SolenoidValve2Way)
+        app = FastAPI()
+        app.include_router(component.router)
+        transport = ASGITransport(app=app)
+        url = "/test-solenoid-2way/valve"
+        async with AsyncClient(transport=transport, base_url="http://sim") as client:
+            assert (await client.put(f"{url}/close")).status_code == 200
+            assert (await client.get(f"{url}/is_open")).json() is False
+            assert (await client.put(f"{url}/open")).status_code == 200
+            assert (await client.get(f"{url}/is_open")).json() is True
+
     async def test_open_and_close(self, solenoid_2way):
         await solenoid_2way.open()
         assert await solenoid_2way.is_open() is True
         await solenoid_2way.close()
         assert await solenoid_2way.is_open() is False
+
+
+class TestSolenoidValveStatusCoalescing:
+
+    async def test_concurrent_status_requests_share_one_query(
+        self, valve_component_no, solenoid_no, mocker
+    ):
+        import asyncio
+
+        spy = mocker.spy(solenoid_no, "is_open")
+        results = await asyncio.gather(
+            *(valve_component_no.is_open() for _ in range(5))
+        )
+        assert results == [True] * 5
+        assert spy.call_count == 1
+
+    async def test_status_after_close_is_fresh(self, valve_component_no):
+        assert await valve_component_no.is_open() is True
+        await valve_component_no.close()
+        assert await valve_component_no.is_open() is False
+
+    async def test_cached_status_after_open_is_fresh(
+        self, valve_component_no, solenoid_no, mocker
+    ):
+        valve_component_no._state_cache.ttl = 60
+        spy = mocker.spy(solenoid_no, "is_open")
+        assert await valve_component_no.is_open() is True
+        assert await valve_component_no.is_open() is True
+        assert spy.call_count == 1
+        await valve_component_no.close()
+        assert await valve_component_no.is_open() is False
+        await valve_component_no.open()
+        assert await valve_component_no.is_open() is True
+        assert spy.call_count == 3
+
+
+class TestSupportPlatformRegistration:
+
+    async def test_initialize_waits_for_relay_registration(self):
+        import asyncio
+
+        from flowchem.components.device_info import DeviceInfo
+        from flowchem.devices.biochem.solenoid_valve import BioChemSolenoidValve
+        from flowchem.devices.flowchem_device import FlowchemDevice
+
+        valve = BioChemSolenoidValve(
+            name="late-valve", support_platform="late-box/relay-A", timeout=5
+        )
+        task = asyncio.create_task(valve.initialize())
+        await asyncio.sleep(0)
+        assert not task.done()
+
+        stub = FlowchemDevice.__new__(FlowchemDevice)
+        stub.name = "late-box"
+        stub.device_info = DeviceInfo()
+        stub.components = []
+        relay = _SimulatedRelay("relay-A", stub)
+        await asyncio.wait_for(task, 1)
+        assert valve._io is relay
+
+    async def test_initialize_times_out(self):
+        from flowchem.devices.biochem.solenoid_valve import BioChemSolenoidValve
+        from flowchem.utils.exceptions import InvalidConfigurationError
+
+        valve = BioChemSolenoidValve(
+            name="orphan-valve", support_platform="missing/relay-A", timeout=0.01
+        )
+        with pytest.raises(InvalidConfigurationError):
+            await valve.initialize()
+
+
+class TestSwitchBoxBackedValve:
+
+    async def test_valve_on_box_wide_channel(self):
+        from flowchem.devices.biochem.solenoid_valve import BioChemSolenoidValve
+        from flowchem.sim.devices.custom.switchbox_sim import SwitchBoxMPIKGSim
+
+        box = SwitchBoxMPIKGSim.from_config(port="SIM", name="valve-box")
+        await box.initialize()
+        valve = BioChemSolenoidValve(
+            name="box-valve",
+            support_platform="valve-box/relay-B",
+            channel=10,
+            normally_open=False,
+        )
+        await valve.initialize()
+        assert await valve.is_open() is False
+        assert await valve.open() is True
+        assert await valve.is_open() is True
+        assert (await box.get_relay_channels())["b"][1] == 2
+
+    async def test_invalid_channel(self):
+        from flowchem.devices.biochem.solenoid_valve import BioChemSolenoidValve
+        from flowchem.sim.devices.custom.switchbox_sim import SwitchBoxMPIKGSim
+        from flowchem.utils.exceptions import InvalidConfigurationError
+
+        box = SwitchBoxMPIKGSim.from_config(port="SIM", name="bad-box")
+        await box.initialize()
+        # Channel 17 belongs to relay-C, not to relay-B (channels 1-8 and 9-16)
+        valve = BioChemSolenoidValve(
+            name="bad", support_platform="bad-box/relay-B", channel=17
+        )
+        with pytest.raises(InvalidConfigurationError):
+            await valve.initialize()
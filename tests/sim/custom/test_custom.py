@@ -69,6 +69,15 @@ class TestSimulatedSwitchBoxIO:
         reply = io._dispatch("get ver")
         assert "SIM" in reply
 
+    def test_set_all_ports_command(self):
+        from flowchem.devices.custom.mpikg_switch_box import SwitchBoxBeferelayCommand
+
+        command = SwitchBoxBeferelayCommand(port="abcd", bits_command_list=[1, 2, 3, 4])
+        assert command.compile() == b"set abcd:1,2,3,4\r"
+        io = SimulatedSwitchBoxIO()
+        assert io._dispatch(command.compile().decode("ascii").strip()) == "OK"
+        assert io._sim_ports == {"a": 1, "b": 2, "c": 3, "d": 4}
+
 
 class TestSwitchBoxMPIKGSim:
 
@@ -102,16 +111,475 @@ class TestSwitchBoxMPIKGSim:
         result = await switchbox.set_dac(ureg.Quantity("2.5 V"), channel=1)
         assert result is True
 
+    async def test_get_dac_raw_bits(self, switchbox):
+        await switchbox.set_dac(ureg.Quantity("2.5 V"), channel=2)
+        assert await switchbox.get_dac(channel=2, volts=False) == 1024
+        assert await switchbox.get_dac(channel=2) == 2.5
+
+    async def test_adc_read_all_single_transaction(self, switchbox, mocker):
+        adc = next(c for c in switchbox.components if c.name == "adc")
+        spy = mocker.spy(switchbox.box_io, "write_and_read_reply")
+        result = await adc.read_all()
+        assert list(result) == [f"ADC{ch}" for ch in range(1, 9)]
+        assert spy.call_count == 1
+
+    async def test_adc_read_all_coalescing(self, switchbox, mocker):
+        import asyncio
+
+        adc = next(c for c in switchbox.components if c.name == "adc")
+        spy = mocker.spy(switchbox, "get_adc")
+        results = await asyncio.gather(*(adc.read_all() for _ in range(5)))
+        assert all(r == results[0] for r in results)
+        assert spy.call_count == 1
+
+    async def test_adc_read_single_channel(self, switchbox, mocker):
+        import asyncio
+
+        adc = next(c for c in switchbox.components if c.name == "adc")
+        spy = mocker.spy(switchbox.box_io, "write_and_read_reply")
+        assert await asyncio.gather(adc.read("3"), adc.read(5)) == [0.0, 0.0]
+        assert spy.call_args.kwargs["command"].compile() == b"get adcx\r"
+        with pytest.raises(AttributeError):
+            await adc.read("9")
+        assert spy.call_count == 1
+
+    async def test_adc_read_all_raw(self, switchbox):
+        import numpy as np
+
+        adc = next(c for c in switchbox.components if c.name == "adc")
+        expected = await adc.read_all()
+        response = await adc.read_all_raw()
+        assert response.media_type == "application/octet-stream"
+        assert response.headers["X-Channels"].split(",") == list(expected)
+        samples = np.frombuffer(response.body, "<f4")
+        assert samples == pytest.approx(list(expected.values()), rel=1e-6)
+
+    async def test_conditional_get(self, relay_a):
+        from fastapi import FastAPI
+        from httpx import ASGITransport, AsyncClient
+
+        app = FastAPI()
+        app.include_router(relay_a.router)
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://sim") as client:
+            url = "/test-switchbox/relay-A/is-on?channel=1"
+            first = await client.get(url)
+            assert first.status_code == 200
+            etag = first.headers["ETag"]
+            unchanged = await client.get(url, headers={"If-None-Match": etag})
+            assert unchanged.status_code == 304
+            assert unchanged.content == b""
+            await relay_a.power_on("1")
+            changed = await client.get(url, headers={"If-None-Match": etag})
+            assert changed.status_code == 200
+            assert changed.headers["ETag"] != etag
+            # Only the polling routes are conditional
+            other = await client.get("/test-switchbox/relay-A/channels_set_point")
+            assert other.status_code == 200
+            assert "ETag" not in other.headers
+
+    async def test_int_channels(self, switchbox, relay_a):
+        # Python callers may pass the channels as ints, like the API labels
+        assert await relay_a.power_on(channel=3) is True
+        assert await relay_a.is_on(3) is True
+        assert await relay_a.read_channel_set_point(3) == 2
+        dac = next(c for c in switchbox.components if c.name == "dac")
+        assert await dac.set(channel=1, value="2500 mV") is True
+        assert await dac.read(1) == pytest.approx(2.5, abs=0.01)
+
+    async def test_dac_component_set(self, switchbox):
+        dac = next(c for c in switchbox.components if c.name == "dac")
+        assert await dac.set(channel="1", value="2500 mV") is True
+        assert switchbox.sim_io._sim_dac[1] == int(2.5 * 4096 / 10)
+        assert await dac.set(channel="1", value="2 s") is False
+        assert await dac.set(channel="1", value="2 +") is False
+        assert await dac.set(channel="1", value="1/0 V") is False
+        assert await dac.set(channel="1", value="(2 V") is False
+        assert await dac.set(channel="1", value="3 foo") is False
+        assert await dac.set(channel="3", value="1 V") is False
+
+    def test_dac_parse_volts(self):
+        from flowchem.components.technical.DAC import DigitalAnalogConverter
+
+        assert DigitalAnalogConverter._parse_volts("2.5 V") == 2.5
+        assert DigitalAnalogConverter._parse_volts("500mV") == 0.5
+        assert DigitalAnalogConverter._parse_volts("1.5") == 1.5
+        assert DigitalAnalogConverter._parse_volts("2 volt") == 2
+
     async def test_relay_component_power_on(self, relay_a):
         await relay_a.power_on()
 
     async def test_relay_component_power_off(self, relay_a):
         await relay_a.power_off()
 
+    async def test_relay_component_set_channel_invalid(self, relay_a, mocker):
+        spy = mocker.spy(relay_a.hw_device, "set_relay_single_channel")
+        assert await relay_a.set_channel("9", "2") is False
+        assert await relay_a.set_channel("1", "3") is False
+        assert await relay_a.set_channel("1", "x") is False
+        assert spy.call_count == 0
+        assert await relay_a.set_channel("1", "1") is True
+
     async def test_relay_component_is_on(self, relay_a):
         result = await relay_a.is_on()
         assert isinstance(result, bool)
 
+    async def test_relay_component_switch_multiple_channel(self, relay_a):
+        assert await relay_a.switch_multiple_channel("0012") is True
+        assert await relay_a.read_channels_set_point() == [0, 0, 1, 2, 0, 0, 0, 0]
+        assert await relay_a.switch_multiple_channel("1111111122") is True
+        assert await relay_a.read_channels_set_point() == [1] * 8
+        with pytest.raises(ValueError):
+            await relay_a.switch_multiple_channel("01x")
+
+    async def test_relay_component_switch_all_ports(self, switchbox, mocker):
+        relay_b = next(c for c in switchbox.components if c.name == "relay-B")
+        await relay_b.switch_multiple_channel("11")
+        spy = mocker.spy(switchbox.box_io, "write_and_read_reply")
+        assert await relay_b.switch_all_ports({"a": "0012", "C": "2"}) is True
+        assert spy.call_count == 1
+        channels = await switchbox.get_relay_channels()
+        assert channels["a"] == [0, 0, 1, 2, 0, 0, 0, 0]
+        assert channels["b"] == [1, 1, 0, 0, 0, 0, 0, 0]
+        assert channels["c"] == [2, 0, 0, 0, 0, 0, 0, 0]
+        assert channels["d"] == [0] * 8
+        assert await relay_b.switch_all_ports({"e": "0"}) is False
+        with pytest.raises(ValueError):
+            await relay_b.switch_all_ports({"a": "01x"})
+        # Empty input is rejected, rather than resending the state of every port
+        spy.reset_mock()
+        assert await relay_b.switch_all_ports({}) is False
+        assert spy.call_count == 0
+
+    async def test_relay_component_switch_all_ports_low_power(self, switchbox):
+        import asyncio
+
+        relay_a = next(c for c in switchbox.components if c.name == "relay-A")
+        assert await relay_a.switch_all_ports({"a": "2", "b": "2"}, "10 ms") is True
+        assert switchbox.low_power_after["a"] == switchbox.low_power_after["b"] == 0.01
+        assert switchbox.low_power_after["c"] == -1
+        await asyncio.sleep(0.05)
+        channels = await switchbox.get_relay_channels()
+        assert channels["a"][0] == channels["b"][0] == 1
+        assert await relay_a.switch_all_ports({"a": "2"}, "0 s") is True
+        assert switchbox.low_power_after["a"] == -1
+
+    async def test_relay_channels_route(self, switchbox):
+        from fastapi import FastAPI
+        from httpx import ASGITransport, AsyncClient
+
+        paths = [
+            route.path
+            for component in switchbox.components
+            for route in component.router.routes
+            if route.path.endswith("/channels")
+        ]
+        assert paths == ["/test-switchbox/relay-A/channels"]
+        relay_a = next(c for c in switchbox.components if c.name == "relay-A")
+        app = FastAPI()
+        app.include_router(relay_a.router)
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://sim") as client:
+            response = await client.put(
+                "/test-switchbox/relay-A/channels", json={"a": "00120001", "d": "1"}
+            )
+        assert response.json() is True
+        channels = await switchbox.get_relay_channels()
+        assert channels["a"] == [0, 0, 1, 2, 0, 0, 0, 1]
+        assert channels["d"][0] == 1
+
+    async def test_relay_state_cache(self, mocker):
+        device = SwitchBoxMPIKGSim.from_config(
+            port="SIM", name="test-switchbox-ttl", state_cache_ttl=60
+        )
+        await device.initialize()
+        relay = next(c for c in device.components if c.name == "relay-A")
+        spy = mocker.spy(device.box_io, "write_and_read_reply")
+
+        # The relay status read by initialize() is still fresh
+        assert await relay.is_on("1") is False
+        assert await relay.is_on("1") is False
+        assert spy.call_count == 0
+        # Commands invalidate the cache, the next read reaches the hardware
+        await relay.power_on("1")
+        assert await relay.is_on("1") is True
+        # Including the device-level commands
+        relay_b = next(c for c in device.components if c.name == "relay-B")
+        assert await relay_b.is_on("9") is False
+        assert await device.set_relay_port([2], port="b") is True
+        assert await relay_b.is_on("9") is True
+        with pytest.raises(AttributeError):
+            await relay_b.is_on("1 ")
+
+    async def test_relay_channel_set_point_snapshot(self, mocker):
+        device = SwitchBoxMPIKGSim.from_config(
+            port="SIM", name="test-switchbox-snapshot", state_cache_ttl=60
+        )
+        await device.initialize()
+        relays = [c for c in device.components if c.name.startswith("relay-")]
+        await relays[1].switch_multiple_channel("012")
+        spy = mocker.spy(device.box_io, "write_and_read_reply")
+        states = [
+            await relay.read_channel_set_point(str(ch))
+            for relay in relays
+            for ch in range(1, 9)
+        ]
+        assert spy.call_count == 1
+        assert states[8:11] == [0, 1, 2]
+        assert sum(states) == 3
+
+    async def test_relay_status_coalescing(self, switchbox, mocker):
+        import asyncio
+
+        spy = mocker.spy(switchbox.box_io, "write_and_read_reply")
+        results = await asyncio.gather(
+            *(switchbox.get_relay_channels() for _ in range(8))
+        )
+        assert all(r == results[0] for r in results)
+        assert spy.call_count == 1
+        # A command invalidates the shared status, the next read is fresh
+        await switchbox.set_relay_port([2], port="c")
+        assert (await switchbox.get_relay_channels())["c"][0] == 2
+
+    async def test_relay_channels_set_point_mask(self, relay_a):
+        await relay_a.switch_multiple_channel("21000002")
+        mask = await relay_a.read_channels_set_point_mask()
+        states = [((mask >> (8 + i)) & 1) + ((mask >> i) & 1) for i in range(8)]
+        assert states == await relay_a.read_channels_set_point()
+        assert states == [2, 1, 0, 0, 0, 0, 0, 2]
+
+    async def test_relay_low_power_approach(self, switchbox):
+        import asyncio
+
+        await switchbox.set_lower_power_approach(port="a", switch_to_low_after=0.01)
+        assert await switchbox.set_relay_single_channel(channel=1, value=2) is True
+        # The command returns at full power, the switch to half power runs in background
+        assert (await switchbox.get_relay_channels())["a"][0] == 2
+        await asyncio.sleep(0.05)
+        assert (await switchbox.get_relay_channels())["a"][0] == 1
+        # Disabling the approach cancels a pending switch
+        await switchbox.set_relay_single_channel(channel=2, value=2)
+        await switchbox.set_lower_power_approach(port="a", switch_to_low_after=-1)
+        await asyncio.sleep(0.05)
+        assert (await switchbox.get_relay_channels())["a"][:2] == [1, 2]
+
+    async def test_relay_port_short_values(self, switchbox):
+        values = [1, 2]
+        assert await switchbox.set_relay_port(values, port="b") is True
+        assert values == [1, 2]
+        assert (await switchbox.get_relay_words())["b"] == 0b11 << 8 | 0b10
+        assert (await switchbox.get_relay_channels())["b"] == [1, 2, 0, 0, 0, 0, 0, 0]
+
+    async def test_relay_single_channel_mapping(self, switchbox):
+        assert await switchbox.set_relay_single_channel(32, port_identify="d") is True
+        assert await switchbox.set_relay_single_channel(3, port_identify="d") is True
+        assert (await switchbox.get_relay_channels())["d"] == [0, 0, 2, 0, 0, 0, 0, 2]
+        assert await switchbox.set_relay_single_channel(12, port_identify="B") is True
+        assert (await switchbox.get_relay_channels())["b"][3] == 2
+        assert await switchbox.set_relay_single_channel(20, port_identify="b") is False
+        assert await switchbox.set_relay_single_channel(0, port_identify="a") is False
+        assert await switchbox.set_relay_single_channel(33, port_identify="d") is False
+
+    async def test_relay_single_channel_reset_port(self, switchbox, mocker):
+        await switchbox.set_relay_port([2, 2], port="a")
+        spy = mocker.spy(switchbox, "get_relay_channels")
+        assert await switchbox.set_relay_single_channel(3, keep_port_status=False)
+        # The other channels are reset, no need to read them first
+        assert spy.call_count == 0
+        assert (await switchbox.get_relay_channels())["a"][:3] == [0, 0, 2]
+
+    async def test_relay_single_channel_port_cache(self, switchbox, mocker):
+        await switchbox.set_relay_port([2, 1], port="c")
+        spy = mocker.spy(switchbox.box_io, "write_and_read_reply")
+        assert await switchbox.set_relay_single_channel(20, port_identify="c")
+        # The other channels are known from the last command, only the set is sent
+        assert spy.call_count == 1
+        assert (await switchbox.get_relay_channels())["c"][:4] == [2, 1, 0, 2]
+        # A change made behind the driver is only seen on refresh
+        switchbox.sim_io._sim_ports["c"] = 0
+        assert await switchbox.set_relay_single_channel(
+            18, value=1, port_identify="c", refresh=True
+        )
+        assert (await switchbox.get_relay_channels())["c"][:4] == [0, 1, 0, 0]
+
+    async def test_relay_single_channel_batching(self, switchbox, relay_a, mocker):
+        import asyncio
+
+        spy = mocker.spy(switchbox.box_io, "write_and_read_reply")
+        results = await asyncio.gather(
+            relay_a.power_on("1"),
+            relay_a.power_on("3"),
+            relay_a.set_channel("4", "1"),
+            switchbox.set_relay_single_channel(10, port_identify="b"),
+        )
+        assert results == [True] * 4
+        # One merged command per port
+        assert spy.call_count == 2
+        channels = await switchbox.get_relay_channels()
+        assert channels["a"] == [2, 0, 2, 1, 0, 0, 0, 0]
+        assert channels["b"] == [0, 2, 0, 0, 0, 0, 0, 0]
+        # Sequential changes are still sent one by one
+        assert await relay_a.power_off("1") is True
+        assert await relay_a.power_off("3") is True
+        assert (await switchbox.get_relay_channels())["a"][:4] == [0, 0, 0, 1]
+
+    async def test_relay_single_channel_flush_cancelled(self, switchbox, relay_a):
+        import asyncio
+
+        async with switchbox._batch_locks["a"]:
+            pending = asyncio.create_task(relay_a.power_on("1"))
+            await asyncio.sleep(0)
+            (flush,) = switchbox._flush_tasks
+            flush.cancel()
+            # The callers of the batch are not left waiting
+            with pytest.raises(asyncio.CancelledError):
+                await pending
+        assert not switchbox._flush_tasks
+        # Later changes start a new batch
+        assert await relay_a.power_on("2") is True
+        assert (await switchbox.get_relay_channels())["a"][:2] == [0, 2]
+
+    async def test_relay_single_channel_with_port_write(
+        self, switchbox, relay_a, mocker
+    ):
+        import asyncio
+
+        write_and_read_reply = switchbox.box_io.write_and_read_reply
+
+        async def slow_write_and_read_reply(command):
+            await asyncio.sleep(0.01)
+            return await write_and_read_reply(command)
+
+        mocker.patch.object(
+            switchbox.box_io, "write_and_read_reply", slow_write_and_read_reply
+        )
+        results = await asyncio.gather(
+            relay_a.set_channel("2", "2"),
+            relay_a.switch_multiple_channel("00000002"),
+        )
+        assert results == [True, True]
+        # Either order is fine, but neither write is lost
+        assert (await switchbox.get_relay_channels())["a"] in (
+            [0, 0, 0, 0, 0, 0, 0, 2],
+            [0, 2, 0, 0, 0, 0, 0, 2],
+        )
+
+    async def test_relay_single_channel_unknown_port(self, switchbox):
+        assert await switchbox.set_relay_single_channel(3, port_identify="z") is False
+
+    async def test_low_power_cancelled_during_write(self, switchbox, relay_a, mocker):
+        import asyncio
+
+        write_and_read_reply = switchbox.box_io.write_and_read_reply
+
+        async def slow_reply(command):
+            # The box applies the command, but its reply is slow
+            reply = await write_and_read_reply(command)
+            await asyncio.sleep(0.05)
+            return reply
+
+        mocker.patch.object(switchbox.box_io, "write_and_read_reply", slow_reply)
+        await switchbox.set_lower_power_approach(port="a", switch_to_low_after=0.01)
+        assert await relay_a.power_on("1") is True
+        # The half-power write is on the wire
+        await asyncio.sleep(0.03)
+        assert switchbox.sim_io._sim_ports["a"] == 0x0100
+        await switchbox.set_lower_power_approach(port="a", switch_to_low_after=-1)
+        assert await relay_a.power_on("1") is True
+        assert (await switchbox.get_relay_channels())["a"][0] == 2
+
+    async def test_relay_channels_map(self, switchbox, mocker):
+        await switchbox.set_relay_port([1, 1], port="b")
+        spy = mocker.spy(switchbox.box_io, "write_and_read_reply")
+        assert await switchbox.set_relay_channels({1: 2, 10: 0, 11: 2, 32: 1}) is True
+        assert spy.call_count == 1
+        channels = await switchbox.get_relay_channels()
+        assert channels["a"] == [2, 0, 0, 0, 0, 0, 0, 0]
+        assert channels["b"] == [1, 0, 2, 0, 0, 0, 0, 0]
+        assert channels["d"] == [0, 0, 0, 0, 0, 0, 0, 1]
+        assert await switchbox.set_relay_channels({33: 1}) is False
+        assert await switchbox.set_relay_channels({1: 3}) is False
+
+    async def test_relay_channels_map_state(self, mocker):
+        import asyncio
+
+        device = SwitchBoxMPIKGSim.from_config(
+            port="SIM", name="test-switchbox-map", state_cache_ttl=60
+        )
+        await device.initialize()
+        relay_a = next(c for c in device.components if c.name == "relay-A")
+        assert await relay_a.is_on("1") is False
+        assert await device.set_relay_channels({1: 2}) is True
+        assert await relay_a.is_on("1") is True
+        # Concurrent single-channel changes are not lost, even with a slow box
+        write_and_read_reply = device.box_io.write_and_read_reply
+
+        async def slow_write_and_read_reply(command):
+            await asyncio.sleep(0.01)
+            return await write_and_read_reply(command)
+
+        mocker.patch.object(
+            device.box_io, "write_and_read_reply", slow_write_and_read_reply
+        )
+        results = await asyncio.gather(
+            relay_a.power_on("2"),
+            device.set_relay_channels({3: 1, 9: 2}),
+            relay_a.power_on("4"),
+        )
+        assert results == [True] * 3
+        channels = await device.get_relay_channels()
+        assert channels["a"][:4] == [2, 2, 1, 2]
+        assert channels["b"][0] == 2
+
+    async def test_relay_single_channel_no_op(self, switchbox, relay_a, mocker):
+        assert await relay_a.power_on("2") is True
+        spy = mocker.spy(switchbox.box_io, "write_and_read_reply")
+        # Already in the requested state, no command is sent
+        assert await relay_a.power_on("2") is True
+        assert await relay_a.power_off("5") is True
+        assert spy.call_count == 0
+        # The low power approach needs the command to start its timer
+        await relay_a.set_lower_power_approach("10 s")
+        assert await relay_a.power_on("2") is True
+        assert spy.call_count == 1
+
+    async def test_relay_port_invalid(self, switchbox):
+        assert await switchbox.set_relay_port([1], port="e") is False
+        # Composite and start-up ports do not hold a single 8-channel relay bank
+        assert await switchbox.set_relay_port([1], port="abcd") is False
+        assert await switchbox.set_relay_port([1], port="starta") is False
+
+    async def test_relay_bitmap(self, switchbox):
+        await switchbox.set_relay_port([2, 0, 1], port="a")
+        await switchbox.set_relay_port([0, 2], port="c")
+        assert await switchbox.get_relay_bitmap() == 0b101 | 0b10 << 16
+        relay_c = next(c for c in switchbox.components if c.name == "relay-C")
+        assert await relay_c.is_on("18") is True
+        assert await relay_c.is_on("1") is False
+
+    async def test_relay_channel_labels(self, switchbox, relay_a):
+        relay_b = next(c for c in switchbox.components if c.name == "relay-B")
+        # Port b accepts both its local ("1".."8") and box-wide ("9".."16") channels
+        assert await relay_b.set_channel("10", value="2") is True
+        assert await relay_b.read_channel_set_point("2") == 2
+        assert await relay_b.read_channel_set_point("10") == 2
+        assert await relay_a.read_channel_set_point("10") is None
+        assert await relay_a.set_channel("x", value="2") is False
+
+    def test_relay_component_ontology(self, relay_a):
+        assert relay_a.component_info.owl_subclass_of == [
+            "http://purl.obolibrary.org/obo/OBI_0000968",
+            "https://w3id.org/saref#Switch",
+        ]
+
+    def test_ontology_union_without_duplicates(self, relay_a):
+        from flowchem.devices.custom.mpikg_switch_box_component import SwitchBoxRelay
+
+        class _Relay(SwitchBoxRelay):
+            OWL_SUBCLASSES = ("https://w3id.org/saref#Switch",)
+
+        assert _Relay._owl_table == SwitchBoxRelay._owl_table
+
 
 # ---------------------------------------------------------------------------
 # PeltierCooler